@@ -22,7 +22,7 @@ from readme_checker.core import (
 )
 from readme_checker.core.validator import Issue
 from readme_checker.core.parser import CodeBlock
-from readme_checker.plugins.base import PluginRegistry
+from readme_checker.plugins.base import PluginRegistry, VerificationResult
 from readme_checker.reporters import RichReporter, JsonReporter
 
 # 创建 Typer 应用实例（不使用子命令模式）
@@ -61,10 +61,10 @@ def find_readme(repo_path: Path) -> Path | None:
 
 
 # Shell 代码块的语言标识符
-SHELL_LANGUAGES = {'bash', 'sh', 'shell', 'console', 'terminal', 'zsh'}
+SHELL_LANGUAGES = frozenset({'bash', 'sh', 'shell', 'console', 'terminal', 'zsh'})
 
-# 常见命令前缀
-COMMAND_PREFIXES = [
+# 常见命令前缀（元组，供 str.startswith 一次匹配）
+COMMAND_PREFIXES = (
     'npm ', 'yarn ', 'pnpm ', 'npx ',
     'python ', 'python3 ', 'pip ', 'poetry ', 'pipenv ',
     'go ', 'cargo ', 'rustc ', 'rustup ',  # Go & Rust
@@ -72,7 +72,7 @@ COMMAND_PREFIXES = [
     'gcc ', 'g++ ', 'clang ', 'clang++ ',  # Compilers
     'docker ', 'kubectl ',
     'mvn ', './mvnw ', 'gradle ', './gradlew ',  # Java
-]
+)
 
 
 def extract_commands_from_code_blocks(code_blocks: list[CodeBlock]) -> list[tuple[str, int]]:
@@ -90,15 +90,11 @@ def extract_commands_from_code_blocks(code_blocks: list[CodeBlock]) -> list[tupl
     commands: list[tuple[str, int]] = []
     
     for block in code_blocks:
-        # 只处理 shell 类型的代码块
-        lang = (block.language or '').lower()
-        if lang and lang not in SHELL_LANGUAGES:
-            continue
-        
-        # 如果没有语言标记，跳过（避免误判）
-        if not lang:
+        # 只处理 shell 类型的代码块；没有语言标记的也跳过（避免误判）
+        if not block.language or block.language.lower() not in SHELL_LANGUAGES:
             continue
         
+        # 按 '\n' 切分而非 splitlines()，后者还会在 \f、\u2028 等字符处断行，导致行号偏移
         for i, line in enumerate(block.content.split('\n')):
             line = line.strip()
             
@@ -113,7 +109,7 @@ def extract_commands_from_code_blocks(code_blocks: list[CodeBlock]) -> list[tupl
                 line = line[2:]
             
             # 只提取看起来像命令的行
-            if any(line.startswith(prefix) for prefix in COMMAND_PREFIXES):
+            if line.startswith(COMMAND_PREFIXES):
                 commands.append((line, block.line_number + i))
     
     return commands
@@ -128,15 +124,20 @@ def validate_commands(
     """
     验证 README 中的命令是否有效
     
-    使用 plugin.verify_command() 检查命令
+    使用 plugin.verify_command() 检查命令。README 中同一命令常在多处重复出现，
+    每条不同的命令只验证一次，重复出现时复用结果（仍按各自行号报告）。
     """
     issues: list[Issue] = []
     
     if not plugin:
         return issues
     
+    verified: dict[str, Optional[VerificationResult]] = {}
     for cmd, line_num in commands:
-        result = plugin.verify_command(cmd, repo_path)
+        if cmd in verified:
+            result = verified[cmd]
+        else:
+            result = verified[cmd] = plugin.verify_command(cmd, repo_path)
         if result and result.status == "missing":
             issues.append(Issue(
                 severity="warning",
@@ -184,6 +185,12 @@ def main(
         "--repo-url",
         help="Repository URL pattern for absolute URL detection",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of processes for scanning source files (default: 1, serial)",
+    ),
     version: bool = typer.Option(
         False,
         "--version",
@@ -268,10 +275,10 @@ def main(
             file_count += 1
             console.print(f"[dim]  ({language}) {file_path}[/dim]")
         
-        scan_result = scan_code_files(repo_path, on_file=on_file_scanned)
+        scan_result = scan_code_files(repo_path, on_file=on_file_scanned, workers=jobs)
         console.print(f"[dim]  Scanned {file_count} files[/dim]")
     else:
-        scan_result = scan_code_files(repo_path)
+        scan_result = scan_code_files(repo_path, workers=jobs)
     
     if verbose:
         console.print(f"[dim]  - {len(scan_result.env_vars)} env var usages[/dim]")
@@ -340,25 +347,15 @@ def main(
             result.issues.extend(version_issues)
         
         if "license" not in ignored_checks:
-            license_file = repo_path / "LICENSE"
-            license_content = None
-            if license_file.exists():
-                try:
-                    license_content = license_file.read_text(encoding="utf-8")
-                except Exception:
-                    pass
-            
+            # 只比较 README 与包配置中的许可证，不需要读取 LICENSE 文件
             license_issues = validator.validate_license(
                 readme_content,
                 metadata.license,
-                license_content,
             )
             result.issues.extend(license_issues)
     
     # 更新统计
-    result.stats["total_issues"] = len(result.issues)
-    result.stats["errors"] = sum(1 for i in result.issues if i.severity == "error")
-    result.stats["warnings"] = sum(1 for i in result.issues if i.severity == "warning")
+    result.update_issue_stats()
     result.stats["env_vars_found"] = len(scan_result.env_vars)
     result.stats["system_deps_found"] = len(scan_result.system_deps)
     result.stats["commands_found"] = len(commands)
@@ -10,8 +10,19 @@ from dataclasses import dataclass, field
 from typing import Optional
 from markdown_it import MarkdownIt
 
+# 共享的解析器实例：构造 MarkdownIt 要建立全部规则链，开销与解析一个小文件相当；
+# parse() 每次调用都使用独立的状态对象，实例可以重复使用
+_MARKDOWN_PARSER = MarkdownIt()
 
-@dataclass
+# Header ID：需要移除的字符（保留字母数字、空白、连字符和中文字符）
+_HEADER_ID_STRIP_RE = re.compile(r'[^\w\s\-\u4e00-\u9fff]')
+
+# Header ID：空白与连字符组成的连续片段，整段替换为一个连字符
+# （等价于先把空白转为连字符、再合并连续连字符，但只扫描一遍）
+_HEADER_ID_SEPARATOR_RE = re.compile(r'[\s\-]+')
+
+
+@dataclass(slots=True)
 class Link:
     """
     链接数据模型
@@ -30,7 +41,7 @@ class Link:
     anchor: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Header:
     """
     标题数据模型
@@ -47,7 +58,7 @@ class Header:
     line_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock:
     """
     代码块数据模型
@@ -99,13 +110,10 @@ def generate_header_id(text: str) -> str:
     result = text.lower()
     
     # 移除非字母数字字符（保留空格、连字符和中文字符）
-    result = re.sub(r'[^\w\s\-\u4e00-\u9fff]', '', result)
-    
-    # 空格转换为连字符
-    result = re.sub(r'\s+', '-', result)
+    result = _HEADER_ID_STRIP_RE.sub('', result)
     
-    # 移除连续的连字符
-    result = re.sub(r'-+', '-', result)
+    # 空格转换为连字符，并合并连续的连字符
+    result = _HEADER_ID_SEPARATOR_RE.sub('-', result)
     
     # 移除首尾连字符
     result = result.strip('-')
@@ -126,8 +134,7 @@ def parse_markdown(content: str) -> ParsedMarkdown:
     Returns:
         ParsedMarkdown 对象
     """
-    md = MarkdownIt()
-    tokens = md.parse(content)
+    tokens = _MARKDOWN_PARSER.parse(content)
     
     links: list[Link] = []
     headers: list[Header] = []
@@ -166,8 +173,9 @@ def parse_markdown(content: str) -> ParsedMarkdown:
         # 提取内联元素（链接、图片）
         elif token.type == 'inline' and token.children:
             line_num = token.map[0] + 1 if token.map else 1
+            children = token.children
             
-            for j, child in enumerate(token.children):
+            for j, child in enumerate(children):
                 if child.type == 'image':
                     # 图片: ![alt](path)
                     src = child.attrGet('src') or ""
@@ -186,8 +194,8 @@ def parse_markdown(content: str) -> ParsedMarkdown:
                     
                     # 获取链接文本
                     link_text = ""
-                    if j + 1 < len(token.children):
-                        next_child = token.children[j + 1]
+                    if j + 1 < len(children):
+                        next_child = children[j + 1]
                         if next_child.type == 'text':
                             link_text = next_child.content or ""
                     
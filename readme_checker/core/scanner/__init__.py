@@ -42,6 +42,7 @@ from readme_checker.core.scanner.package_managers import (
 from readme_checker.core.scanner.python_ast import (
     extract_env_vars_ast,
     extract_config_library_env_vars,
+    extract_all_python_env_vars,
 )
 
 __all__ = [
@@ -72,4 +73,5 @@ __all__ = [
     # Python AST
     "extract_env_vars_ast",
     "extract_config_library_env_vars",
+    "extract_all_python_env_vars",
 ]
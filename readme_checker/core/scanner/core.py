@@ -5,8 +5,12 @@
 """
 
 import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from readme_checker.core.scanner.models import (
     EnvVarUsage,
@@ -15,15 +19,14 @@ from readme_checker.core.scanner.models import (
     ScanResult,
 )
 from readme_checker.core.scanner.patterns import (
-    ENV_VAR_PATTERNS,
-    SYSTEM_DEP_PATTERNS,
+    FUSED_ENV_VAR_PATTERNS,
+    FUSED_SYSTEM_DEP_PATTERNS,
+    ENV_VAR_LITERALS,
+    SYSTEM_DEP_LITERALS,
     EXTENSION_TO_LANGUAGE,
-    COMMON_SYSTEM_TOOLS,
-)
-from readme_checker.core.scanner.python_ast import (
-    extract_env_vars_ast,
-    extract_config_library_env_vars,
+    IGNORED_DIR_NAMES,
 )
+from readme_checker.core.scanner.python_ast import extract_all_python_env_vars
 from readme_checker.core.scanner.js_ast import (
     extract_env_vars_js_ast,
     ESPRIMA_AVAILABLE,
@@ -34,18 +37,37 @@ logger = logging.getLogger(__name__)
 # AST 文件大小限制 (10MB)
 AST_FILE_SIZE_LIMIT = 10 * 1024 * 1024
 
+# 二进制嗅探读取的字符数：开头含 NUL 的文件视为二进制（扩展名误标的产物等）
+BINARY_SNIFF_SIZE = 4096
+
 # 进度回调类型
 ProgressCallback = Callable[[str, str], None]
 
+# 并行扫描时每个进程的待处理任务数上限（限制同时驻留内存的文件内容）
+SCAN_PENDING_PER_WORKER = 4
+
+# 单个文件的扫描任务: (文件内容, 文件大小, 相对路径, 语言, 是否使用 AST)
+_ScanTask = tuple[str, int, str, str, bool]
+
+# 单个文件的扫描结果: (环境变量, 无法解析的引用, 系统依赖)
+_ScanOutcome = tuple[list[EnvVarUsage], list[UnresolvedRef], list[SystemDependency]]
+
+# 整行注释：跳过前导空白后以注释符开头（\s 与 str.strip() 的空白定义一致）
+_C_COMMENT_LINE_RE = re.compile(r'\s*(?://|/\*|\*)')
+_COMMENT_LINE_RES = {
+    "python": re.compile(r'\s*#'),
+    "javascript": _C_COMMENT_LINE_RE,
+    "go": _C_COMMENT_LINE_RE,
+    "java": _C_COMMENT_LINE_RE,
+    "rust": _C_COMMENT_LINE_RE,
+    "c": _C_COMMENT_LINE_RE,
+}
+
 
 def _is_comment_line(line: str, language: str) -> bool:
-    """判断是否为注释行"""
-    stripped = line.strip()
-    if language == "python":
-        return stripped.startswith('#')
-    elif language in ("javascript", "go", "java", "rust", "c"):
-        return stripped.startswith('//') or stripped.startswith('/*') or stripped.startswith('*')
-    return False
+    """判断是否为注释行（单次正则匹配，不为每行生成 strip() 副本）"""
+    pattern = _COMMENT_LINE_RES.get(language)
+    return pattern is not None and pattern.match(line) is not None
 
 
 def _strip_comments(line: str, language: str) -> str:
@@ -59,6 +81,10 @@ def _strip_comments(line: str, language: str) -> str:
     - 字符串内的注释符号不会被误判
     """
     if language == "python":
+        # 没有 # 的行不可能有注释，跳过逐字符扫描
+        if '#' not in line:
+            return line
+        
         # 简单处理：找到 # 但要避免字符串内的 #
         in_string = None
         for i, char in enumerate(line):
@@ -72,6 +98,10 @@ def _strip_comments(line: str, language: str) -> str:
         return line
     
     elif language in ("javascript", "go", "java", "rust", "c"):
+        # 没有 / 的行不可能有 // 或 /* 注释，跳过逐字符扫描
+        if '/' not in line:
+            return line
+        
         # 处理 // 和 /* */ 注释，但要避免字符串内的
         result = []
         in_string = None
@@ -116,11 +146,16 @@ def _remove_block_comments(content: str, language: str) -> str:
     """
     移除跨行块注释 /* ... */
     
-    这个函数在逐行处理之前调用，用于处理跨行的块注释
+    这个函数在逐行处理之前调用，用于处理跨行的块注释。
+    扫描单个文件时由 _scan_file 调用一次，结果同时用于环境变量和系统依赖提取。
     """
     if language not in ("javascript", "go", "java", "rust", "c"):
         return content
     
+    # 没有块注释起始符时内容不会变化，跳过逐字符扫描
+    if '/*' not in content:
+        return content
+    
     result = []
     in_string = None
     in_block_comment = False
@@ -160,6 +195,11 @@ def _remove_block_comments(content: str, language: str) -> str:
     return ''.join(result)
 
 
+def _contains_any(content: str, literals: tuple[str, ...]) -> bool:
+    """判断内容是否包含任一字面量"""
+    return any(literal in content for literal in literals)
+
+
 def extract_env_vars(content: str, file_path: str, language: str) -> list[EnvVarUsage]:
     """从代码中提取环境变量引用（正则模式）
     
@@ -169,13 +209,19 @@ def extract_env_vars(content: str, file_path: str, language: str) -> list[EnvVar
     - 移除行内注释后再匹配
     - 避免注释中的误报
     """
+    return _extract_env_vars_cleaned(_remove_block_comments(content, language), file_path, language)
+
+
+def _extract_env_vars_cleaned(cleaned_content: str, file_path: str, language: str) -> list[EnvVarUsage]:
+    """extract_env_vars 的主体，content 已移除块注释"""
     env_vars: list[EnvVarUsage] = []
-    patterns = ENV_VAR_PATTERNS.get(language, [])
-    if not patterns:
+    fused = FUSED_ENV_VAR_PATTERNS.get(language)
+    if fused is None:
         return env_vars
     
-    # 先移除跨行块注释
-    cleaned_content = _remove_block_comments(content, language)
+    # 字面量预过滤：整段内容不可能命中时跳过逐行匹配
+    if not _contains_any(cleaned_content, ENV_VAR_LITERALS[language]):
+        return env_vars
     
     lines = cleaned_content.split('\n')
     for line_num, line in enumerate(lines, 1):
@@ -186,16 +232,16 @@ def extract_env_vars(content: str, file_path: str, language: str) -> list[EnvVar
         # 移除行内注释，只匹配有效代码部分
         code_part = _strip_comments(line, language)
         
-        for pattern, group_idx in patterns:
-            for match in pattern.finditer(code_part):
-                var_name = match.group(group_idx)
-                env_vars.append(EnvVarUsage(
-                    name=var_name,
-                    file_path=file_path,
-                    line_number=line_num,
-                    column_number=match.start(),
-                    pattern=pattern.pattern,
-                ))
+        for match in fused.regex.finditer(code_part):
+            group_name = match.lastgroup
+            group_idx, pattern = fused.groups[group_name]
+            env_vars.append(EnvVarUsage(
+                name=match.group(group_idx),
+                file_path=file_path,
+                line_number=line_num,
+                column_number=match.start(group_name),
+                pattern=pattern,
+            ))
     return env_vars
 
 
@@ -208,16 +254,21 @@ def extract_system_deps(content: str, file_path: str, language: str) -> list[Sys
     - 移除行内注释后再匹配
     - 去重：同一行同一工具只报告一次
     """
+    return _extract_system_deps_cleaned(_remove_block_comments(content, language), file_path, language)
+
+
+def _extract_system_deps_cleaned(cleaned_content: str, file_path: str, language: str) -> list[SystemDependency]:
+    """extract_system_deps 的主体，content 已移除块注释"""
     deps: list[SystemDependency] = []
-    patterns = SYSTEM_DEP_PATTERNS.get(language, [])
-    if not patterns:
+    fused = FUSED_SYSTEM_DEP_PATTERNS.get(language)
+    if fused is None:
         return deps
     
     # 用于去重：(行号, 工具名)
     seen: set[tuple[int, str]] = set()
     
-    # 先移除跨行块注释
-    cleaned_content = _remove_block_comments(content, language)
+    if not _contains_any(cleaned_content, SYSTEM_DEP_LITERALS[language]):
+        return deps
     
     lines = cleaned_content.split('\n')
     for line_num, line in enumerate(lines, 1):
@@ -228,32 +279,51 @@ def extract_system_deps(content: str, file_path: str, language: str) -> list[Sys
         # 移除行内注释
         code_part = _strip_comments(line, language)
         
-        for pattern, group_idx in patterns:
-            for match in pattern.finditer(code_part):
-                tool_name = match.group(group_idx)
-                tool_lower = tool_name.lower()
-                
-                # 检查是否在工具列表中，并去重
-                if tool_lower in COMMON_SYSTEM_TOOLS:
-                    key = (line_num, tool_lower)
-                    if key not in seen:
-                        seen.add(key)
-                        deps.append(SystemDependency(
-                            tool_name=tool_name,
-                            file_path=file_path,
-                            line_number=line_num,
-                            invocation=line.strip()[:100],
-                        ))
+        # 模式只匹配 COMMON_SYSTEM_TOOLS 中的工具，这里只需去重
+        # 调用片段（截断到 100 字符）每行最多生成一次，没有命中的行不生成
+        invocation = None
+        for match in fused.regex.finditer(code_part):
+            group_idx, _ = fused.groups[match.lastgroup]
+            tool_name = match.group(group_idx)
+            key = (line_num, tool_name.lower())
+            if key not in seen:
+                seen.add(key)
+                if invocation is None:
+                    invocation = line.strip()[:100]
+                deps.append(SystemDependency(
+                    tool_name=tool_name,
+                    file_path=file_path,
+                    line_number=line_num,
+                    invocation=invocation,
+                ))
     return deps
 
 
+def _regex_env_vars(
+    content: str,
+    cleaned_content: Optional[str],
+    file_path: str,
+    language: str,
+) -> list[EnvVarUsage]:
+    """正则提取；调用方已移除块注释时直接复用"""
+    if cleaned_content is None:
+        cleaned_content = _remove_block_comments(content, language)
+    return _extract_env_vars_cleaned(cleaned_content, file_path, language)
+
+
 def extract_env_vars_smart(
     content: str,
     file_path: str,
     language: str,
     file_size: int = 0,
+    cleaned_content: Optional[str] = None,
 ) -> tuple[list[EnvVarUsage], list[UnresolvedRef]]:
-    """智能提取环境变量 - AST 优先，正则回退"""
+    """
+    智能提取环境变量 - AST 优先，正则回退
+    
+    cleaned_content 为已移除块注释的内容（可选），正则回退时直接使用；
+    AST 解析始终使用原始内容。
+    """
     unresolved: list[UnresolvedRef] = []
     
     # JavaScript/TypeScript
@@ -262,22 +332,21 @@ def extract_env_vars_smart(
             js_env_vars, js_unresolved = extract_env_vars_js_ast(content, file_path)
             if js_env_vars or js_unresolved:
                 return js_env_vars, js_unresolved
-        return extract_env_vars(content, file_path, language), unresolved
+        return _regex_env_vars(content, cleaned_content, file_path, language), unresolved
     
     # 非 Python 直接用正则
     if language != "python":
-        return extract_env_vars(content, file_path, language), unresolved
+        return _regex_env_vars(content, cleaned_content, file_path, language), unresolved
     
     # 大文件跳过 AST
     if file_size > AST_FILE_SIZE_LIMIT:
         logger.warning(f"File {file_path} exceeds {AST_FILE_SIZE_LIMIT} bytes, using regex fallback")
-        return extract_env_vars(content, file_path, language), unresolved
+        return _regex_env_vars(content, cleaned_content, file_path, language), unresolved
     
     # Python AST 解析
     try:
-        ast_env_vars, ast_unresolved = extract_env_vars_ast(content, file_path)
+        ast_env_vars, config_env_vars, ast_unresolved = extract_all_python_env_vars(content, file_path)
         unresolved.extend(ast_unresolved)
-        config_env_vars = extract_config_library_env_vars(content, file_path)
         
         # 合并去重
         seen_names: set[str] = set()
@@ -290,10 +359,108 @@ def extract_env_vars_smart(
         return all_env_vars, unresolved
     except SyntaxError as e:
         logger.warning(f"Syntax error in {file_path}, using regex fallback: {e}")
-        return extract_env_vars(content, file_path, language), unresolved
+        return _regex_env_vars(content, cleaned_content, file_path, language), unresolved
     except Exception as e:
         logger.warning(f"AST parsing failed for {file_path}, using regex fallback: {e}")
-        return extract_env_vars(content, file_path, language), unresolved
+        return _regex_env_vars(content, cleaned_content, file_path, language), unresolved
+
+
+def _read_source(path: str, rel_path: str) -> Optional[tuple[str, int]]:
+    """
+    读取源文件
+    
+    打开一次：大小取自句柄的 fstat，不再按路径另做一次 stat。
+    先读开头一段嗅探二进制，命中时不再读取余下内容。
+    
+    Returns:
+        (内容, 文件大小)；二进制文件的内容为空串；文件无法读取时返回 None
+    """
+    try:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            head = f.read(BINARY_SNIFF_SIZE)
+            if '\x00' in head:
+                logger.debug(f"Skipping binary file {rel_path}")
+                return "", file_size
+            return head + f.read(), file_size
+    except Exception:
+        return None
+
+
+def _scan_file(task: _ScanTask) -> _ScanOutcome:
+    """
+    扫描单个文件的内容
+    
+    只依赖参数和模块级状态，可在进程池的子进程中执行。
+    """
+    content, file_size, rel_path, language, use_ast = task
+    if not content:
+        return [], [], []
+    
+    # 块注释只移除一次，环境变量的正则提取和系统依赖提取共用
+    cleaned_content = _remove_block_comments(content, language)
+    
+    if use_ast:
+        env_vars, unresolved = extract_env_vars_smart(
+            content, rel_path, language, file_size, cleaned_content,
+        )
+    else:
+        env_vars = _extract_env_vars_cleaned(cleaned_content, rel_path, language)
+        unresolved = []
+    
+    deps = _extract_system_deps_cleaned(cleaned_content, rel_path, language)
+    return env_vars, unresolved, deps
+
+
+def _scan_files_parallel(tasks: Iterable[_ScanTask], workers: int) -> Iterator[_ScanOutcome]:
+    """
+    用进程池并行扫描，按 tasks 的顺序产出结果
+    
+    扫描以纯 Python 的正则和 AST 处理为主，受 GIL 限制，线程无法并行，因此使用进程。
+    任务边读边提交，待处理任务数有上限，不会一次把整个仓库读入内存。
+    进程池出现任何故障（无法启动、子进程异常退出、任务无法序列化等）时，
+    尚未取回结果的任务和其余任务改为在当前进程中串行扫描。
+    """
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except Exception as e:
+        logger.debug(f"Parallel scan unavailable, falling back to serial: {e}")
+        yield from map(_scan_file, tasks)
+        return
+    
+    pending: deque[tuple[_ScanTask, Optional[Future]]] = deque()
+    max_pending = workers * SCAN_PENDING_PER_WORKER
+    broken = False
+    
+    def fail(error: BaseException) -> None:
+        nonlocal broken
+        logger.debug(f"Parallel scan failed, falling back to serial: {error}")
+        broken = True
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def collect() -> _ScanOutcome:
+        task, future = pending.popleft()
+        if future is not None and not broken:
+            try:
+                return future.result()
+            except Exception as e:
+                fail(e)
+        # 子进程中抛出的扫描异常在这里重现，与串行扫描的行为一致
+        return _scan_file(task)
+    
+    with executor:
+        for task in tasks:
+            future = None
+            if not broken:
+                try:
+                    future = executor.submit(_scan_file, task)
+                except Exception as e:
+                    fail(e)
+            pending.append((task, future))
+            if len(pending) >= max_pending:
+                yield collect()
+        while pending:
+            yield collect()
 
 
 def scan_code_files(
@@ -301,59 +468,96 @@ def scan_code_files(
     extensions: Optional[list[str]] = None,
     use_ast: bool = True,
     on_file: Optional[ProgressCallback] = None,
+    workers: Optional[int] = None,
 ) -> ScanResult:
-    """扫描代码文件"""
+    """
+    扫描代码文件
+    
+    Args:
+        repo_path: 仓库根目录
+        extensions: 只扫描这些扩展名；None 表示全部支持的语言
+        use_ast: 是否优先使用 AST 提取环境变量
+        on_file: 进度回调 (相对路径, 语言)，在文件读取成功后、扫描前调用
+        workers: 并行扫描的进程数；None 或不大于 1 时在当前进程中串行扫描
+    """
     result = ScanResult()
     
+    # 扩展名过滤与语言映射合并为一次字典查找
     if extensions is None:
-        extensions = list(EXTENSION_TO_LANGUAGE.keys())
-    
-    ignore_dirs = {
-        'node_modules', '.git', '__pycache__', '.venv', 'venv',
-        'dist', 'build', '.next', 'target', 'vendor',
-    }
+        ext_map = EXTENSION_TO_LANGUAGE
+    else:
+        ext_set = frozenset(extensions)
+        ext_map = {ext: lang for ext, lang in EXTENSION_TO_LANGUAGE.items() if ext in ext_set}
     
-    def safe_walk(path: Path):
+    def safe_walk(path: str):
+        # os.scandir 的目录项自带类型信息，普通条目判断目录/文件时无需 stat；
+        # 被忽略的目录在下探前剪掉，整棵子树都不会被列出。
+        # 相对路径随下探逐级拼接，不为每个文件构造 Path 再 relative_to。
+        # 用显式栈保存各层打开的目录迭代器，顺序与递归的深度优先遍历相同，
+        # 但每个文件不必逐层经过嵌套的生成器
+        try:
+            root = os.scandir(path)
+        except (OSError, PermissionError):
+            return
+        stack = [(root, "")]
         try:
-            for entry in path.iterdir():
+            while stack:
+                entries, rel_prefix = stack[-1]
+                try:
+                    entry = next(entries, None)
+                except (OSError, PermissionError):
+                    entry = None
+                if entry is None:
+                    entries.close()
+                    stack.pop()
+                    continue
                 try:
                     if entry.is_dir():
-                        if entry.name not in ignore_dirs:
-                            yield from safe_walk(entry)
+                        if entry.name not in IGNORED_DIR_NAMES:
+                            try:
+                                sub_entries = os.scandir(entry.path)
+                            except (OSError, PermissionError):
+                                continue
+                            stack.append((sub_entries, rel_prefix + entry.name + os.sep))
                     elif entry.is_file():
-                        yield entry
+                        yield entry.path, entry.name, rel_prefix + entry.name
                 except (OSError, PermissionError):
                     continue
-        except (OSError, PermissionError):
-            return
+        finally:
+            for entries, _ in stack:
+                entries.close()
     
-    for file_path in safe_walk(repo_path):
-        if file_path.suffix.lower() not in extensions:
-            continue
-        language = EXTENSION_TO_LANGUAGE.get(file_path.suffix.lower())
-        if not language:
-            continue
-        
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            file_size = file_path.stat().st_size
-        except Exception:
-            continue
-        
-        rel_path = str(file_path.relative_to(repo_path))
-        
-        if on_file:
-            on_file(rel_path, language)
-        
-        if use_ast:
-            env_vars, unresolved = extract_env_vars_smart(content, rel_path, language, file_size)
-            result.env_vars.extend(env_vars)
-            result.unresolved_refs.extend(unresolved)
-        else:
-            env_vars = extract_env_vars(content, rel_path, language)
-            result.env_vars.extend(env_vars)
-        
-        deps = extract_system_deps(content, rel_path, language)
+    def read_tasks():
+        # 边遍历边读取；串行与并行扫描都在读取成功后、扫描前触发进度回调
+        for path, name, rel_path in safe_walk(os.fspath(repo_path)):
+            # 与 Path.suffix 相同的规则：最后一个点之后，且不算开头的点和结尾的点
+            dot = name.rfind('.')
+            if not 0 < dot < len(name) - 1:
+                continue
+            suffix = name[dot:]
+            # 映射的键都是小写：扩展名本身是小写时（绝大多数情况）省去一次 lower()
+            language = ext_map.get(suffix) or ext_map.get(suffix.lower())
+            if language is None:
+                continue
+            
+            source = _read_source(path, rel_path)
+            if source is None:
+                continue
+            
+            if on_file:
+                on_file(rel_path, language)
+            
+            content, file_size = source
+            yield content, file_size, rel_path, language, use_ast
+    
+    if workers is not None and workers > 1:
+        outcomes = _scan_files_parallel(read_tasks(), workers)
+    else:
+        outcomes = map(_scan_file, read_tasks())
+    
+    for env_vars, unresolved, deps in outcomes:
+        result.env_vars.extend(env_vars)
+        result.unresolved_refs.extend(unresolved)
         result.system_deps.extend(deps)
     
     return result
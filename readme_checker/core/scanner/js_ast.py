@@ -75,15 +75,109 @@ class JSEnvVarExtractor:
     def extract(self, content: str) -> tuple[list[EnvVarUsage], list[UnresolvedRef]]:
         if not ESPRIMA_AVAILABLE:
             return [], []
+        # 快速路径：只有 process.env.X 形式时，词法分析即可完成提取
+        if self._extract_from_tokens(content):
+            return self.env_vars, self.unresolved
         try:
             ast_tree = esprima.parseScript(content, {"tolerant": True, "loc": True})
-            self._collect_variables(ast_tree.toDict())
-            self._visit(ast_tree.toDict())
+            ast_dict = ast_tree.toDict()
+            self._collect_variables(ast_dict)
+            self._visit(ast_dict)
             return self.env_vars, self.unresolved
         except Exception as e:
             logger.debug(f"JS AST parsing failed for {self.file_path}: {e}")
             return [], []
     
+    def _extract_from_tokens(self, content: str) -> bool:
+        """
+        基于 token 流提取 process.env.X 引用
+        
+        遇到下标访问 process.env[...] 或 configService.get(...) 等
+        需要变量追踪/调用分析的写法时放弃，返回 False 交给完整 AST 解析。
+        """
+        try:
+            tokens = esprima.tokenize(content, {"loc": True})
+        except Exception as e:
+            logger.debug(f"JS tokenize failed for {self.file_path}: {e}")
+            return False
+        
+        found: list[EnvVarUsage] = []
+        # 具名函数上下文栈：(函数名, 函数体所在的花括号深度)
+        contexts: list[tuple[str, int]] = []
+        pending_context: Optional[tuple[str, int]] = None
+        brace_depth = 0
+        paren_depth = 0
+        count = len(tokens)
+        
+        for i in range(count):
+            token = tokens[i]
+            token_type = token.type
+            value = token.value
+            
+            if token_type == "Punctuator":
+                if value in ("(", "["):
+                    paren_depth += 1
+                elif value in (")", "]"):
+                    paren_depth -= 1
+                elif value == "{":
+                    brace_depth += 1
+                    if pending_context and pending_context[1] == paren_depth:
+                        contexts.append((pending_context[0], brace_depth))
+                        pending_context = None
+                elif value == "}":
+                    if contexts and contexts[-1][1] == brace_depth:
+                        contexts.pop()
+                    brace_depth -= 1
+                continue
+            if token_type == "Keyword" and value == "function":
+                j = i + 1
+                if j < count and tokens[j].value == "*":
+                    j += 1
+                if j < count and tokens[j].type == "Identifier":
+                    pending_context = (tokens[j].value, paren_depth)
+                continue
+            
+            if token_type != "Identifier" or i + 3 >= count:
+                continue
+            if tokens[i + 1].value != "." or tokens[i + 1].type != "Punctuator":
+                continue
+            
+            if value == "process" and tokens[i + 2].value == "env":
+                if i > 0 and tokens[i - 1].type == "Punctuator" and tokens[i - 1].value == ".":
+                    continue
+                accessor = tokens[i + 3]
+                if accessor.type == "Punctuator" and accessor.value == "[":
+                    return False  # 下标访问需要变量追踪
+                if accessor.type != "Punctuator" or accessor.value != ".":
+                    continue
+                if i + 4 >= count:
+                    continue
+                prop = tokens[i + 4]
+                if prop.type not in ("Identifier", "Keyword", "Boolean", "Null"):
+                    continue
+                if pending_context:
+                    context = pending_context[0]
+                elif contexts:
+                    context = contexts[-1][0]
+                else:
+                    context = self._current_context
+                start = token.loc.start
+                found.append(EnvVarUsage(
+                    name=prop.value,
+                    file_path=self.file_path,
+                    line_number=start.line,
+                    column_number=start.column,
+                    pattern="ast:process.env.X",
+                    context=context,
+                ))
+            elif tokens[i + 2].value in ("get", "getOrThrow") and tokens[i + 3].value == "(":
+                name_lower = value.lower()
+                if "config" in name_lower or "env" in name_lower:
+                    return False  # configService.get(...) 需要调用分析
+        
+        self.env_vars.extend(found)
+        return True
+    
     def _collect_variables(self, node: dict) -> None:
         if not isinstance(node, dict):
             return
@@ -200,7 +294,8 @@ class JSEnvVarExtractor:
             prop = callee.get("property", {})
             if prop.get("type") == "Identifier" and prop.get("name") in ("get", "getOrThrow"):
                 obj_name = obj.get("name", "") if obj.get("type") == "Identifier" else ""
-                if "config" in obj_name.lower() or "env" in obj_name.lower():
+                name_lower = obj_name.lower()
+                if "config" in name_lower or "env" in name_lower:
                     first_arg = args[0]
                     if first_arg.get("type") == "Literal" and isinstance(first_arg.get("value"), str):
                         self.env_vars.append(EnvVarUsage(
@@ -5,11 +5,36 @@
 """
 
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Optional
 
+# 尝试导入 orjson（更快的 JSON 编解码）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def _flat_to_dict(cls):
+    """
+    为只含标量字段的记录类生成 to_dict
+    
+    字段名和取值器在类定义时确定，调用时不经过 asdict 的递归遍历和深拷贝。
+    """
+    names = tuple(f.name for f in fields(cls))
+    get_values = attrgetter(*names)
+    
+    def to_dict(self) -> dict:
+        return dict(zip(names, get_values(self)))
+    
+    cls.to_dict = to_dict
+    return cls
+
+
+@_flat_to_dict
+@dataclass(slots=True)
 class EnvVarUsage:
     """
     环境变量使用记录
@@ -32,7 +57,8 @@ class EnvVarUsage:
     context: Optional[str] = None
 
 
-@dataclass
+@_flat_to_dict
+@dataclass(slots=True)
 class UnresolvedRef:
     """
     无法解析的动态引用
@@ -51,7 +77,8 @@ class UnresolvedRef:
     reason: str
 
 
-@dataclass
+@_flat_to_dict
+@dataclass(slots=True)
 class SystemDependency:
     """
     系统依赖使用记录
@@ -82,19 +109,35 @@ class ScanResult:
     system_deps: list[SystemDependency] = field(default_factory=list)
     unresolved_refs: list[UnresolvedRef] = field(default_factory=list)
     
+    def to_dict(self) -> dict:
+        """转换为可 JSON 序列化的字典"""
+        return {
+            "env_vars": [ev.to_dict() for ev in self.env_vars],
+            "system_deps": [sd.to_dict() for sd in self.system_deps],
+            "unresolved_refs": [ur.to_dict() for ur in self.unresolved_refs],
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        序列化为 UTF-8 编码的 JSON，写入文件或套接字时省去解码步骤
+        
+        orjson 原生支持 dataclass，直接序列化自身，不经过 to_dict 构建中间字典树；
+        字段顺序与 to_dict 一致，输出相同。
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+    
     def to_json(self) -> str:
         """序列化为 JSON 字符串"""
-        data = {
-            "env_vars": [asdict(ev) for ev in self.env_vars],
-            "system_deps": [asdict(sd) for sd in self.system_deps],
-            "unresolved_refs": [asdict(ur) for ur in self.unresolved_refs],
-        }
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            return self.to_json_bytes().decode("utf-8")
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
     
     @classmethod
-    def from_json(cls, json_str: str) -> "ScanResult":
-        """从 JSON 字符串反序列化"""
-        data = json.loads(json_str)
+    def from_json(cls, json_str: str | bytes) -> "ScanResult":
+        """从 JSON 字符串（或 UTF-8 字节串）反序列化"""
+        data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
         return cls(
             env_vars=[EnvVarUsage(**ev) for ev in data.get("env_vars", [])],
             system_deps=[SystemDependency(**sd) for sd in data.get("system_deps", [])],
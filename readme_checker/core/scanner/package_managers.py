@@ -68,23 +68,34 @@ PACKAGE_MANAGERS: list[PackageManagerPattern] = [
     ),
 ]
 
+# 安装参数的清理规则：依次去掉 && 之后的命令、行尾续行符、注释
+_ARGS_CLEANUP_RES = (
+    re.compile(r'\s+&&.*'),
+    re.compile(r'\s+\\$'),
+    re.compile(r'\s*#.*'),
+)
+
+# 包名后的版本约束（pkg=1.0、pkg>=2 等）
+_VERSION_SPEC_RE = re.compile(r'[=<>].*')
+
 
 def extract_documented_packages(content: str) -> dict[str, set[str]]:
     """从 README 或 Dockerfile 内容中提取已文档化的包"""
     documented: dict[str, set[str]] = {}
     
+    # sudo 变体不能并入无 sudo 的模式：finditer 不返回重叠匹配，
+    # 像 "apt install a && sudo apt install b" 这样的行需要两个模式各扫一遍
     for pm in PACKAGE_MANAGERS:
         packages: set[str] = set()
         for pattern in pm.install_patterns:
             for match in pattern.finditer(content):
                 pkg_str = match.group(1).strip()
-                pkg_str = re.sub(r'\s+&&.*', '', pkg_str)
-                pkg_str = re.sub(r'\s+\\$', '', pkg_str)
-                pkg_str = re.sub(r'\s*#.*', '', pkg_str)
+                for cleanup_re in _ARGS_CLEANUP_RES:
+                    pkg_str = cleanup_re.sub('', pkg_str)
                 for pkg in pkg_str.split():
                     if pkg.startswith('-'):
                         continue
-                    pkg = re.sub(r'[=<>].*', '', pkg)
+                    pkg = _VERSION_SPEC_RE.sub('', pkg)
                     if pkg:
                         packages.add(pkg.lower())
         if packages:
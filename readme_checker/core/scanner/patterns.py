@@ -5,6 +5,8 @@
 """
 
 import re
+import sys
+from dataclasses import dataclass
 
 # 环境变量提取模式
 ENV_VAR_PATTERNS: dict[str, list[tuple[re.Pattern, int]]] = {
@@ -37,37 +39,86 @@ ENV_VAR_PATTERNS: dict[str, list[tuple[re.Pattern, int]]] = {
     ],
 }
 
+# 常见的系统工具（用于过滤）
+# 注意：这里只包含真正需要用户安装的外部工具
+# 不包含语言运行时（python, node, java 等）因为这些是项目本身的依赖
+COMMON_SYSTEM_TOOLS: frozenset[str] = frozenset(map(sys.intern, (
+    # 多媒体处理
+    "ffmpeg", "ffprobe", "imagemagick", "convert",
+    # 图形/可视化
+    "graphviz", "dot",
+    # 容器/编排
+    "docker", "kubectl", "terraform", "ansible",
+    # 通用工具
+    "git", "curl", "wget", "tar", "zip", "unzip",
+    # 编译工具
+    "gcc", "g++", "clang", "make", "cmake",
+    # 数据库客户端
+    "mysql", "psql", "redis-cli", "mongo", "sqlite3",
+)))
+
+# 工具名交替模式：非工具名在正则引擎内即被拒绝，无需再做集合过滤
+_TOOL_GROUP = r'(?<!\w)((?i:' + '|'.join(
+    re.escape(tool) for tool in sorted(COMMON_SYSTEM_TOOLS, key=lambda t: (-len(t), t))
+) + r'))(?!\w)'
+
+
+def _dep_pattern(template: str) -> re.Pattern:
+    """编译系统依赖模式，模板中的 {tool} 替换为工具名交替组"""
+    return re.compile(template.replace('{tool}', _TOOL_GROUP))
+
+
 # 系统依赖提取模式
 SYSTEM_DEP_PATTERNS: dict[str, list[tuple[re.Pattern, int]]] = {
     "python": [
-        (re.compile(r'subprocess\.(?:run|call|Popen)\s*\(\s*\[?\s*["\'](\w+)["\']'), 1),
-        (re.compile(r'os\.system\s*\(\s*["\'](\w+)'), 1),
-        (re.compile(r'shutil\.which\s*\(\s*["\'](\w+)["\']'), 1),
+        (_dep_pattern(r'subprocess\.(?:run|call|Popen)\s*\(\s*\[?\s*["\']{tool}["\']'), 1),
+        (_dep_pattern(r'os\.system\s*\(\s*["\']{tool}'), 1),
+        (_dep_pattern(r'shutil\.which\s*\(\s*["\']{tool}["\']'), 1),
     ],
     "javascript": [
         # child_process.exec 要放在 exec 前面，避免重复匹配
-        (re.compile(r'child_process\.exec(?:Sync)?\s*\(\s*["\'](\w+)'), 1),
-        (re.compile(r'(?<!child_process\.)exec(?:Sync)?\s*\(\s*["\'](\w+)'), 1),
-        (re.compile(r'spawn(?:Sync)?\s*\(\s*["\'](\w+)["\']'), 1),
+        (_dep_pattern(r'child_process\.exec(?:Sync)?\s*\(\s*["\']{tool}'), 1),
+        (_dep_pattern(r'(?<!child_process\.)exec(?:Sync)?\s*\(\s*["\']{tool}'), 1),
+        (_dep_pattern(r'spawn(?:Sync)?\s*\(\s*["\']{tool}["\']'), 1),
     ],
     "go": [
-        (re.compile(r'exec\.Command\s*\(\s*["\'](\w+)["\']'), 1),
+        (_dep_pattern(r'exec\.Command\s*\(\s*["\']{tool}["\']'), 1),
     ],
     "c": [
-        (re.compile(r'\bsystem\s*\(\s*["\'](\w+)'), 1),
-        (re.compile(r'\bpopen\s*\(\s*["\'](\w+)'), 1),
-        (re.compile(r'\bexecl?\s*\(\s*["\'][^"\']*?(\w+)["\']'), 1),
+        (_dep_pattern(r'\bsystem\s*\(\s*["\']{tool}'), 1),
+        (_dep_pattern(r'\bpopen\s*\(\s*["\']{tool}'), 1),
+        (_dep_pattern(r'\bexecl?\s*\(\s*["\'][^"\']*?{tool}["\']'), 1),
     ],
     "java": [
-        (re.compile(r'\.exec\s*\(\s*["\'](\w+)'), 1),
-        (re.compile(r'ProcessBuilder\s*\(\s*["\'](\w+)["\']'), 1),
+        (_dep_pattern(r'\.exec\s*\(\s*["\']{tool}'), 1),
+        (_dep_pattern(r'ProcessBuilder\s*\(\s*["\']{tool}["\']'), 1),
     ],
     "rust": [
-        (re.compile(r'Command::new\s*\(\s*["\'](\w+)["\']'), 1),
-        (re.compile(r'process::Command::new\s*\(\s*["\'](\w+)["\']'), 1),
+        (_dep_pattern(r'Command::new\s*\(\s*["\']{tool}["\']'), 1),
+        (_dep_pattern(r'process::Command::new\s*\(\s*["\']{tool}["\']'), 1),
     ],
 }
 
+# 字面量预过滤：每个模式都必然包含其中至少一个子串，
+# 一个都不包含的文件无需再跑正则
+ENV_VAR_LITERALS: dict[str, tuple[str, ...]] = {
+    "python": ("os.getenv", "os.environ"),
+    "javascript": ("process.env",),
+    "go": ("os.Getenv", "os.LookupEnv"),
+    "c": ("getenv",),
+    "java": ("System.getenv", "System.getProperty"),
+    "rust": ("env::var",),
+}
+
+SYSTEM_DEP_LITERALS: dict[str, tuple[str, ...]] = {
+    "python": ("subprocess.", "os.system", "shutil.which"),
+    "javascript": ("exec", "spawn"),
+    "go": ("exec.Command",),
+    "c": ("system", "popen", "exec"),
+    "java": (".exec", "ProcessBuilder"),
+    "rust": ("Command::new",),
+}
+
 # 文件扩展名到语言的映射
 EXTENSION_TO_LANGUAGE: dict[str, str] = {
     ".py": "python",
@@ -88,21 +139,55 @@ EXTENSION_TO_LANGUAGE: dict[str, str] = {
     ".java": "java",
     ".rs": "rust",
 }
+# 驻留键和值：查到的语言名与 ENV_VAR_PATTERNS 等字典的键是同一对象
+EXTENSION_TO_LANGUAGE = {
+    sys.intern(ext): sys.intern(language) for ext, language in EXTENSION_TO_LANGUAGE.items()
+}
 
-# 常见的系统工具（用于过滤）
-# 注意：这里只包含真正需要用户安装的外部工具
-# 不包含语言运行时（python, node, java 等）因为这些是项目本身的依赖
-COMMON_SYSTEM_TOOLS: set[str] = {
-    # 多媒体处理
-    "ffmpeg", "ffprobe", "imagemagick", "convert",
-    # 图形/可视化
-    "graphviz", "dot",
-    # 容器/编排
-    "docker", "kubectl", "terraform", "ansible",
-    # 通用工具
-    "git", "curl", "wget", "tar", "zip", "unzip",
-    # 编译工具
-    "gcc", "g++", "clang", "make", "cmake",
-    # 数据库客户端
-    "mysql", "psql", "redis-cli", "mongo", "sqlite3",
+
+# 不下探的目录（按目录名判断，整棵子树一并跳过）
+# 代码扫描与验证器的文件索引共用这一份，保证两者看到的目录范围一致；
+# 索引中缺失的链接目标会回退到逐个检查
+IGNORED_DIR_NAMES = frozenset({
+    'node_modules', '.git', '__pycache__', '.venv', 'venv',
+    'dist', 'build', '.next', 'target', 'vendor',
+})
+
+
+@dataclass(frozen=True)
+class FusedPattern:
+    """
+    单语言的合并模式
+    
+    Attributes:
+        regex: 所有模式合并后的交替正则
+        groups: 命名组 -> (捕获组序号, 原始模式字符串)
+    """
+    regex: re.Pattern
+    groups: dict[str, tuple[int, str]]
+
+
+def _fuse_patterns(patterns: list[tuple[re.Pattern, int]]) -> FusedPattern:
+    """
+    将同一语言的多个模式合并为单个正则，每个文件只需扫描一遍
+    
+    每个模式包裹在命名组 p0, p1, ... 中，通过 match.lastgroup 找回来源模式。
+    整体放在零宽前瞻里，不同模式的重叠匹配（如 std::getenv 与 getenv）
+    仍会各自报告，结果与逐个模式扫描一致。
+    """
+    alternatives = [f"(?P<p{i}>{pattern.pattern})" for i, (pattern, _) in enumerate(patterns)]
+    regex = re.compile("(?=" + "|".join(alternatives) + ")")
+    groups = {
+        f"p{i}": (regex.groupindex[f"p{i}"] + group_idx, pattern.pattern)
+        for i, (pattern, group_idx) in enumerate(patterns)
+    }
+    return FusedPattern(regex=regex, groups=groups)
+
+
+FUSED_ENV_VAR_PATTERNS: dict[str, FusedPattern] = {
+    language: _fuse_patterns(patterns) for language, patterns in ENV_VAR_PATTERNS.items()
+}
+
+FUSED_SYSTEM_DEP_PATTERNS: dict[str, FusedPattern] = {
+    language: _fuse_patterns(patterns) for language, patterns in SYSTEM_DEP_PATTERNS.items()
 }
@@ -8,10 +8,50 @@ Python AST 环境变量提取
 """
 
 import ast
-from typing import Optional
+from collections import deque
+from typing import Callable, Optional
 
 from readme_checker.core.scanner.models import EnvVarUsage, UnresolvedRef
 
+# 可包含子语句的字段，顺序与各节点 _fields 中的相对顺序一致
+_STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+# 热路径谓词使用的节点类型别名（AST 节点类型不会被子类化，可用 type(x) is 判断）
+_AST_ATTR = ast.Attribute
+_AST_NAME = ast.Name
+_AST_CONST = ast.Constant
+_AST_CALL = ast.Call
+
+# django-environ Env 实例上读取环境变量的方法
+_DJANGO_ENVIRON_METHODS: frozenset[str] = frozenset(
+    ("str", "int", "bool", "float", "list", "dict", "url", "db_url")
+)
+
+# pydantic BaseSettings 的常见引用形式
+_BASE_SETTINGS_NAMES: frozenset[str] = frozenset(
+    ("BaseSettings", "pydantic.BaseSettings", "pydantic_settings.BaseSettings")
+)
+
+
+def _short_dump(node: ast.AST, budget: int = 100) -> str:
+    """
+    生成有长度上限的表达式摘要
+    
+    ast.dump 会序列化整棵子树后再截断，这里只展开常量、名称和属性链，
+    其他节点仅保留类型名，开销与子树大小无关。
+    """
+    if budget <= 0:
+        return "..."
+    node_type = type(node)
+    if node_type is _AST_CONST:
+        return repr(node.value)[:budget]
+    if node_type is _AST_NAME:
+        return node.id[:budget]
+    if node_type is _AST_ATTR:
+        owner = _short_dump(node.value, budget - len(node.attr) - 1)
+        return f"{owner}.{node.attr}"[:budget]
+    return f"{node_type.__name__}(...)"[:budget]
+
 
 class VariableTracker:
     """变量追踪器 - 追踪字符串变量赋值"""
@@ -38,7 +78,71 @@ class VariableTracker:
         return self.list_vars.get(name)
 
 
-class ASTEnvVarExtractor(ast.NodeVisitor):
+class FastNodeVisitor(ast.NodeVisitor):
+    """
+    基于类型分派表的 NodeVisitor
+    
+    ast.NodeVisitor.visit 对每个节点都要拼接 "visit_" + 类名再 getattr，
+    这里在子类创建时把 visit_* 方法收集成 {节点类型: 方法} 的分派表，
+    generic_visit 也直接遍历 _fields，省去 iter_fields 的元组分配。
+    
+    _SKIPPED_FIELDS 中的字段不会被下探：标量字段（标识符、标志位）
+    和 ctx（Load/Store 空节点）。类型注解照常遍历，其中可能包含
+    环境变量读取（如 Annotated[str, os.getenv("A")]）。
+    每种节点类型裁剪后的字段元组按需缓存在 _child_fields 中。
+    """
+    
+    _SKIPPED_FIELDS: frozenset[str] = frozenset((
+        "ctx", "type_comment",
+        "id", "attr", "arg", "name", "module", "level", "kind",
+        "is_async", "conversion",
+    ))
+    
+    _dispatch: dict[type, Callable[["FastNodeVisitor", ast.AST], None]] = {}
+    _child_fields: dict[type, tuple[str, ...]] = {}
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        dispatch = {}
+        for name in dir(cls):
+            if not name.startswith("visit_"):
+                continue
+            method = getattr(cls, name)
+            # 跳过 ast.NodeVisitor 自带的 visit_Constant 兼容实现
+            if method is getattr(ast.NodeVisitor, name, None):
+                continue
+            node_type = getattr(ast, name[len("visit_"):], None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                dispatch[node_type] = method
+        cls._dispatch = dispatch
+        cls._child_fields = {}
+    
+    def visit(self, node: ast.AST) -> None:
+        method = self._dispatch.get(type(node))
+        if method is None:
+            self.generic_visit(node)
+        else:
+            method(self, node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        visit = self.visit
+        node_type = type(node)
+        fields = self._child_fields.get(node_type)
+        if fields is None:
+            skipped = self._SKIPPED_FIELDS
+            fields = tuple(f for f in node._fields if f not in skipped)
+            self._child_fields[node_type] = fields
+        for field in fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            elif isinstance(value, ast.AST):
+                visit(value)
+
+
+class ASTEnvVarExtractor(FastNodeVisitor):
     """AST 环境变量提取器"""
     
     def __init__(self, file_path: str):
@@ -50,31 +154,70 @@ class ASTEnvVarExtractor(ast.NodeVisitor):
         self._comprehension_vars: dict[str, list[str]] = {}
     
     def visit_Module(self, node: ast.Module) -> None:
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name):
-                        self.var_tracker.track_assignment(target.id, child.value)
+        self._collect_assignments(node)
         self.generic_visit(node)
     
+    def _collect_assignments(self, node: ast.Module) -> None:
+        """
+        预先收集模块内所有赋值，使函数内引用后定义的常量也能解析
+        
+        赋值只会出现在语句中，因此只按广度优先展开语句容器，
+        不进入表达式子树；赋值的遍历（覆盖）顺序与 ast.walk 一致。
+        """
+        queue: deque[ast.AST] = deque([node])
+        while queue:
+            current = queue.popleft()
+            if type(current) is ast.Assign:
+                for target in current.targets:
+                    if isinstance(target, ast.Name):
+                        self.var_tracker.track_assignment(target.id, current.value)
+                continue
+            for field in _STATEMENT_FIELDS:
+                children = getattr(current, field, None)
+                if children:
+                    queue.extend(children)
+    
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        old_context = self._current_context
-        self._current_context = node.name
+        old_context = self._enter_class(node)
         self.generic_visit(node)
         self._current_context = old_context
     
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        old_context = self._current_context
-        if self._current_context:
-            self._current_context = f"{self._current_context}.{node.name}"
-        else:
-            self._current_context = node.name
+        old_context = self._enter_function(node)
         self.generic_visit(node)
         self._current_context = old_context
     
     visit_AsyncFunctionDef = visit_FunctionDef
     
     def visit_ListComp(self, node: ast.ListComp) -> None:
+        self._enter_comprehension(node)
+        self.generic_visit(node)
+        self._leave_comprehension(node)
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        self.generic_visit(node)
+        self._check_call(node)
+    
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        self.generic_visit(node)
+        self._check_subscript(node)
+    
+    def _enter_class(self, node: ast.ClassDef) -> Optional[str]:
+        """进入类作用域，返回旧上下文"""
+        old_context = self._current_context
+        self._current_context = node.name
+        return old_context
+    
+    def _enter_function(self, node: ast.FunctionDef) -> Optional[str]:
+        """进入函数作用域，返回旧上下文"""
+        old_context = self._current_context
+        if self._current_context:
+            self._current_context = f"{self._current_context}.{node.name}"
+        else:
+            self._current_context = node.name
+        return old_context
+    
+    def _enter_comprehension(self, node: ast.ListComp) -> None:
         for generator in node.generators:
             if isinstance(generator.target, ast.Name) and isinstance(generator.iter, ast.Name):
                 iter_name = generator.iter.id
@@ -82,38 +225,40 @@ class ASTEnvVarExtractor(ast.NodeVisitor):
                 list_values = self.var_tracker.resolve_list(iter_name)
                 if list_values:
                     self._comprehension_vars[target_name] = list_values
-        self.generic_visit(node)
+    
+    def _leave_comprehension(self, node: ast.ListComp) -> None:
         for generator in node.generators:
             if isinstance(generator.target, ast.Name):
                 self._comprehension_vars.pop(generator.target.id, None)
     
-    def visit_Call(self, node: ast.Call) -> None:
-        self.generic_visit(node)
+    def _check_call(self, node: ast.Call) -> None:
         if self._is_env_call(node):
             self._handle_env_call(node)
     
-    def visit_Subscript(self, node: ast.Subscript) -> None:
-        self.generic_visit(node)
+    def _check_subscript(self, node: ast.Subscript) -> None:
         if self._is_environ_subscript(node):
             self._handle_environ_subscript(node)
     
     def _is_env_call(self, node: ast.Call) -> bool:
         func = node.func
-        if isinstance(func, ast.Attribute):
-            if func.attr == "getenv" and isinstance(func.value, ast.Name) and func.value.id == "os":
-                return True
-            if func.attr == "get" and isinstance(func.value, ast.Attribute):
-                if func.value.attr == "environ" and isinstance(func.value.value, ast.Name):
-                    if func.value.value.id == "os":
-                        return True
+        if type(func) is not _AST_ATTR:
+            return False
+        attr = func.attr
+        if attr == "getenv":
+            value = func.value
+            return type(value) is _AST_NAME and value.id == "os"
+        if attr == "get":
+            value = func.value
+            if type(value) is _AST_ATTR and value.attr == "environ":
+                owner = value.value
+                return type(owner) is _AST_NAME and owner.id == "os"
         return False
     
     def _is_environ_subscript(self, node: ast.Subscript) -> bool:
         value = node.value
-        if isinstance(value, ast.Attribute):
-            if value.attr == "environ" and isinstance(value.value, ast.Name):
-                if value.value.id == "os":
-                    return True
+        if type(value) is _AST_ATTR and value.attr == "environ":
+            owner = value.value
+            return type(owner) is _AST_NAME and owner.id == "os"
         return False
     
     def _handle_env_call(self, node: ast.Call) -> None:
@@ -145,7 +290,7 @@ class ASTEnvVarExtractor(ast.NodeVisitor):
             ))
     
     def _resolve_arg(self, arg: ast.expr, parent_node: ast.AST) -> list[str]:
-        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        if type(arg) is _AST_CONST and type(arg.value) is str:
             return [arg.value]
         if isinstance(arg, ast.Name):
             var_name = arg.id
@@ -166,13 +311,13 @@ class ASTEnvVarExtractor(ast.NodeVisitor):
             file_path=self.file_path,
             line_number=parent_node.lineno,
             column_number=parent_node.col_offset,
-            expression=ast.dump(arg)[:100],
+            expression=_short_dump(arg),
             reason="Dynamic expression not supported",
         ))
         return []
 
 
-class ConfigLibraryDetector(ast.NodeVisitor):
+class ConfigLibraryDetector(FastNodeVisitor):
     """配置库检测器 - pydantic, decouple, django-environ"""
     
     def __init__(self, file_path: str):
@@ -183,36 +328,53 @@ class ConfigLibraryDetector(ast.NodeVisitor):
         self._environ_instances: set[str] = set()
     
     def visit_Import(self, node: ast.Import) -> None:
+        self._record_import(node)
+        self.generic_visit(node)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self._record_import_from(node)
+        self.generic_visit(node)
+    
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self._record_assign(node)
+        self.generic_visit(node)
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        old_class = self._enter_class(node)
+        self.generic_visit(node)
+        self._current_class = old_class
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        self.generic_visit(node)
+        self._check_call(node)
+    
+    def _record_import(self, node: ast.Import) -> None:
         for alias in node.names:
             name = alias.asname or alias.name
             self._imports[name] = alias.name
-        self.generic_visit(node)
     
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def _record_import_from(self, node: ast.ImportFrom) -> None:
         module = node.module or ""
         for alias in node.names:
             name = alias.asname or alias.name
             self._imports[name] = f"{module}.{alias.name}"
-        self.generic_visit(node)
     
-    def visit_Assign(self, node: ast.Assign) -> None:
-        if isinstance(node.value, ast.Call):
+    def _record_assign(self, node: ast.Assign) -> None:
+        if type(node.value) is _AST_CALL:
             if self._is_environ_env_constructor(node.value):
                 for target in node.targets:
                     if isinstance(target, ast.Name):
                         self._environ_instances.add(target.id)
-        self.generic_visit(node)
     
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    def _enter_class(self, node: ast.ClassDef) -> Optional[str]:
+        """提取 BaseSettings 字段并进入类作用域，返回旧类名"""
         if self._is_base_settings_subclass(node):
             self._extract_settings_fields(node)
         old_class = self._current_class
         self._current_class = node.name
-        self.generic_visit(node)
-        self._current_class = old_class
+        return old_class
     
-    def visit_Call(self, node: ast.Call) -> None:
-        self.generic_visit(node)
+    def _check_call(self, node: ast.Call) -> None:
         if self._is_decouple_config(node):
             self._handle_decouple_config(node)
         if self._is_django_environ_call(node):
@@ -221,7 +383,7 @@ class ConfigLibraryDetector(ast.NodeVisitor):
     def _is_base_settings_subclass(self, node: ast.ClassDef) -> bool:
         for base in node.bases:
             base_name = self._get_full_name(base)
-            if base_name in ("BaseSettings", "pydantic.BaseSettings", "pydantic_settings.BaseSettings"):
+            if base_name in _BASE_SETTINGS_NAMES:
                 return True
             if base_name and base_name in self._imports:
                 full_path = self._imports[base_name]
@@ -247,21 +409,21 @@ class ConfigLibraryDetector(ast.NodeVisitor):
     
     def _is_decouple_config(self, node: ast.Call) -> bool:
         func = node.func
-        if isinstance(func, ast.Name) and func.id == "config":
-            if "config" in self._imports:
-                full_path = self._imports["config"]
-                if "decouple" in full_path:
-                    return True
-        if isinstance(func, ast.Attribute) and func.attr == "config":
-            if isinstance(func.value, ast.Name) and func.value.id == "decouple":
-                return True
+        func_type = type(func)
+        if func_type is _AST_NAME:
+            if func.id == "config" and "config" in self._imports:
+                return "decouple" in self._imports["config"]
+            return False
+        if func_type is _AST_ATTR and func.attr == "config":
+            value = func.value
+            return type(value) is _AST_NAME and value.id == "decouple"
         return False
     
     def _handle_decouple_config(self, node: ast.Call) -> None:
         if not node.args:
             return
         arg = node.args[0]
-        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        if type(arg) is _AST_CONST and type(arg.value) is str:
             self.env_vars.append(EnvVarUsage(
                 name=arg.value,
                 file_path=self.file_path,
@@ -274,17 +436,20 @@ class ConfigLibraryDetector(ast.NodeVisitor):
     
     def _is_django_environ_call(self, node: ast.Call) -> bool:
         func = node.func
-        if isinstance(func, ast.Attribute):
-            if func.attr in ("str", "int", "bool", "float", "list", "dict", "url", "db_url"):
-                if isinstance(func.value, ast.Name):
-                    var_name = func.value.id
+        func_type = type(func)
+        if func_type is _AST_ATTR:
+            if func.attr in _DJANGO_ENVIRON_METHODS:
+                value = func.value
+                if type(value) is _AST_NAME:
+                    var_name = value.id
                     if var_name in self._environ_instances:
                         return True
                     if var_name in self._imports:
                         full_path = self._imports.get(var_name, "")
                         if "environ" in full_path.lower():
                             return True
-        if isinstance(func, ast.Name):
+            return False
+        if func_type is _AST_NAME:
             var_name = func.id
             if var_name in self._environ_instances:
                 return True
@@ -296,14 +461,18 @@ class ConfigLibraryDetector(ast.NodeVisitor):
     
     def _is_environ_env_constructor(self, node: ast.Call) -> bool:
         func = node.func
-        if isinstance(func, ast.Attribute) and func.attr == "Env":
-            if isinstance(func.value, ast.Name):
-                var_name = func.value.id
-                if var_name == "environ" or var_name in self._imports:
-                    full_path = self._imports.get(var_name, var_name)
-                    if "environ" in full_path.lower():
-                        return True
-        if isinstance(func, ast.Name) and func.id == "Env":
+        func_type = type(func)
+        if func_type is _AST_ATTR:
+            if func.attr == "Env":
+                value = func.value
+                if type(value) is _AST_NAME:
+                    var_name = value.id
+                    if var_name == "environ" or var_name in self._imports:
+                        full_path = self._imports.get(var_name, var_name)
+                        if "environ" in full_path.lower():
+                            return True
+            return False
+        if func_type is _AST_NAME and func.id == "Env":
             if "Env" in self._imports:
                 full_path = self._imports["Env"]
                 if "environ" in full_path.lower():
@@ -314,7 +483,7 @@ class ConfigLibraryDetector(ast.NodeVisitor):
         if not node.args:
             return
         arg = node.args[0]
-        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        if type(arg) is _AST_CONST and type(arg.value) is str:
             self.env_vars.append(EnvVarUsage(
                 name=arg.value,
                 file_path=self.file_path,
@@ -326,15 +495,73 @@ class ConfigLibraryDetector(ast.NodeVisitor):
             ))
     
     def _get_full_name(self, node: ast.expr) -> Optional[str]:
-        if isinstance(node, ast.Name):
+        node_type = type(node)
+        if node_type is _AST_NAME:
             return node.id
-        if isinstance(node, ast.Attribute):
+        if node_type is _AST_ATTR:
             value_name = self._get_full_name(node.value)
             if value_name:
                 return f"{value_name}.{node.attr}"
         return None
 
 
+class PythonEnvVisitor(FastNodeVisitor):
+    """
+    组合访问器 - 单次遍历同时驱动 ASTEnvVarExtractor 与 ConfigLibraryDetector
+    
+    两个访问器互不共享状态，按同一先序顺序分别收到进入/离开事件，
+    结果与各自单独遍历一致。
+    """
+    
+    def __init__(self, file_path: str):
+        self.extractor = ASTEnvVarExtractor(file_path)
+        self.detector = ConfigLibraryDetector(file_path)
+    
+    def visit_Module(self, node: ast.Module) -> None:
+        self.extractor._collect_assignments(node)
+        self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        self.detector._record_import(node)
+        self.generic_visit(node)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.detector._record_import_from(node)
+        self.generic_visit(node)
+    
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.detector._record_assign(node)
+        self.generic_visit(node)
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        old_context = self.extractor._enter_class(node)
+        old_class = self.detector._enter_class(node)
+        self.generic_visit(node)
+        self.extractor._current_context = old_context
+        self.detector._current_class = old_class
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        old_context = self.extractor._enter_function(node)
+        self.generic_visit(node)
+        self.extractor._current_context = old_context
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        self.extractor._enter_comprehension(node)
+        self.generic_visit(node)
+        self.extractor._leave_comprehension(node)
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        self.generic_visit(node)
+        self.extractor._check_call(node)
+        self.detector._check_call(node)
+    
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        self.generic_visit(node)
+        self.extractor._check_subscript(node)
+
+
 def extract_env_vars_ast(content: str, file_path: str) -> tuple[list[EnvVarUsage], list[UnresolvedRef]]:
     """使用 AST 从 Python 代码中提取环境变量引用"""
     tree = ast.parse(content)
@@ -349,3 +576,19 @@ def extract_config_library_env_vars(content: str, file_path: str) -> list[EnvVar
     detector = ConfigLibraryDetector(file_path)
     detector.visit(tree)
     return detector.env_vars
+
+
+def extract_all_python_env_vars(
+    content: str,
+    file_path: str,
+) -> tuple[list[EnvVarUsage], list[EnvVarUsage], list[UnresolvedRef]]:
+    """
+    单次解析、单次遍历提取 Python 代码中的环境变量
+    
+    Returns:
+        (os.getenv/os.environ 引用, 配置库引用, 无法解析的动态引用)
+    """
+    tree = ast.parse(content)
+    visitor = PythonEnvVisitor(file_path)
+    visitor.visit(tree)
+    return visitor.extractor.env_vars, visitor.detector.env_vars, visitor.extractor.unresolved
@@ -9,12 +9,17 @@
 """
 
 import json
+import os
 import re
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional
 
-from readme_checker.core.parser import Link, Header, CodeBlock, ParsedMarkdown
+from readme_checker.core.parser import Link, Header, CodeBlock, ParsedMarkdown, parse_markdown
+from readme_checker.core.scanner.patterns import IGNORED_DIR_NAMES
 
 # 尝试导入 YAML 解析器
 try:
@@ -23,8 +28,128 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# 目录链接的索引文件（GitHub 会自动渲染）
+INDEX_FILES = ('README.md', 'readme.md', 'index.md', 'INDEX.md')
+
+# 并行预读外部锚点目标文件的最大线程数
+ANCHOR_PREFETCH_WORKERS = 8
+
+# 支持锚点验证的 Markdown 扩展名
+_MARKDOWN_SUFFIXES = ('.md', '.markdown')
+
+# 目录树中的树形字符
+_TREE_CHARS = frozenset('│├└─┌┐┘┬┴┼|+\\')
+
+# 目录树：像文件路径的行（包含 / 或 \ 和扩展名）
+_TREE_PATH_RE = re.compile(r'[\\/].*\.\w+')
+
+# 代码特征模式（用于区分代码与纯文本输出）
+_CODE_PATTERNS = (
+    r'^\s*(?:def|class|function|const|let|var|import|from|export)\s',
+    r'^\s*(?:if|for|while|switch|try|catch)\s*[\(\{]',
+    r'[=;{}()\[\]]',  # 常见代码符号
+    r'^\s*#include\s*<',  # C/C++ include
+    r'^\s*package\s+\w+',  # Java/Go package
+)
+
+# 合并为一个正则，每行只做一次 search（只关心是否命中任一特征）
+_CODE_LINE_RE = re.compile('|'.join(f'(?:{p})' for p in _CODE_PATTERNS))
+
+# 版本号模式: "version: 1.2.3" 或 v1.2.3 / V1.2.3（分隔符不跨行，不区分大小写）
+_VERSION_PATTERN = r'(?:version(?:[^\S\n]|:)+|\bv?)(?P<version>\d+\.\d+\.\d+(?:-[\w.]+)?)\b'
+
+# 常见 Node.js 运行时主版本号，README 中与 node 同行出现时不视为项目版本
+_NODE_RUNTIME_VERSION_PREFIXES = ('14.', '16.', '18.', '20.')
+
+_NEWLINE_RE = re.compile(r'\n')
+
+# 常见 License 名称（按优先级排列）
+LICENSE_NAMES = (
+    'MIT', 'Apache-2.0', 'Apache 2.0', 'GPL-3.0', 'GPL-2.0',
+    'BSD-3-Clause', 'BSD-2-Clause', 'ISC', 'MPL-2.0', 'LGPL-3.0',
+    'Unlicense', 'WTFPL', 'CC0', 'CC-BY-4.0',
+)
+
+# 大写名称 -> (优先级, 规范名称)
+_LICENSE_LOOKUP = {name.upper(): (i, name) for i, name in enumerate(LICENSE_NAMES)}
+
+# License 别名映射（键为统一大写、连字符后的形式）
+_LICENSE_ALIASES = {
+    'APACHE-2.0': 'APACHE-2.0',
+    'APACHE-2': 'APACHE-2.0',
+    'APACHE2': 'APACHE-2.0',
+    'GPL-3': 'GPL-3.0',
+    'GPL3': 'GPL-3.0',
+    'BSD-3': 'BSD-3-CLAUSE',
+    'BSD3': 'BSD-3-CLAUSE',
+}
+
+
+def _canonical_license(license_str: str) -> str:
+    """License 名称的规范形式：统一大写、空格和下划线替换为连字符，再应用别名"""
+    normalized = license_str.upper().replace(' ', '-').replace('_', '-')
+    return _LICENSE_ALIASES.get(normalized, normalized)
+
+
+# 常见写法 -> 规范形式，命中时省去逐次的字符串转换
+_LICENSE_CANONICAL: dict[str, str] = {
+    spelling: _canonical_license(spelling)
+    for name in (*LICENSE_NAMES, *_LICENSE_ALIASES)
+    for spelling in (name, name.lower())
+}
+
+# 所有 License 名称合并为一个整词模式（不区分大小写）
+_LICENSE_PATTERN = (
+    r'\b(?P<license>'
+    + '|'.join(re.escape(name) for name in sorted(LICENSE_NAMES, key=len, reverse=True))
+    + r')\b'
+)
+_LICENSE_RE = re.compile(_LICENSE_PATTERN, re.IGNORECASE)
+
+# 大写字母和下划线组成的词（典型的环境变量命名）
+_ENV_VAR_PATTERN = r'\b(?P<envvar>[A-Z][A-Z0-9_]{2,})\b'
+_ENV_VAR_RE = re.compile(_ENV_VAR_PATTERN)
+
+# README 单次扫描：版本号、License、环境变量候选词合并为一个模式，按 lastgroup 分派
+_README_SCAN_RE = re.compile(
+    r'(?i:' + _VERSION_PATTERN + r')'
+    r'|(?i:' + _LICENSE_PATTERN + r')'
+    r'|' + _ENV_VAR_PATTERN
+)
+
+# 常见的系统环境变量（不要求文档化）
+_COMMON_ENV_VARS: frozenset[str] = frozenset({
+    'PATH', 'HOME', 'USER', 'SHELL', 'LANG', 'TERM',
+    'PWD', 'OLDPWD', 'HOSTNAME', 'LOGNAME',
+    'NODE_ENV', 'DEBUG', 'CI', 'GITHUB_ACTIONS',
+    'PYTHONPATH', 'PYTHONDONTWRITEBYTECODE',
+})
+
+# 常见的非环境变量大写词
+_COMMON_WORDS: frozenset[str] = frozenset({
+    'README', 'TODO', 'FIXME', 'NOTE', 'WARNING', 'ERROR',
+    'API', 'URL', 'URI', 'HTTP', 'HTTPS', 'JSON', 'XML',
+    'HTML', 'CSS', 'SQL', 'CLI', 'GUI', 'SDK', 'IDE',
+    'MIT', 'BSD', 'GPL', 'APACHE',
+})
+
 
 @dataclass
+class _ReadmeScan:
+    """
+    README 单次扫描结果
+    
+    Attributes:
+        versions: (版本号, 匹配起始偏移) 列表
+        license: 按 LICENSE_NAMES 优先级选出的 License
+        env_vars: 提到的环境变量候选词（已过滤常见词）
+    """
+    versions: list[tuple[str, int]] = field(default_factory=list)
+    license: Optional[str] = None
+    env_vars: set[str] = field(default_factory=set)
+
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     """
     检查问题
@@ -45,7 +170,7 @@ class Issue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     验证结果
@@ -56,6 +181,13 @@ class ValidationResult:
     """
     issues: list[Issue] = field(default_factory=list)
     stats: dict[str, int] = field(default_factory=dict)
+    
+    def update_issue_stats(self) -> None:
+        """单次遍历问题列表，更新总数及 error/warning 计数"""
+        counts = Counter(issue.severity for issue in self.issues)
+        self.stats["total_issues"] = len(self.issues)
+        self.stats["errors"] = counts["error"]
+        self.stats["warnings"] = counts["warning"]
 
 
 class Validator:
@@ -71,6 +203,139 @@ class Validator:
         """
         self.repo_path = repo_path
         self.repo_url_pattern = repo_url_pattern
+        # 外部 Markdown 文件的标题 ID 缓存: 路径 -> (mtime_ns, 小写标题 ID 集合)
+        self._anchor_cache: dict[Path, tuple[int, frozenset[str]]] = {}
+        self._repo_str = os.fspath(repo_path)
+        # 仓库文件索引（相对 POSIX 路径），首次检查链接时构建
+        self._fs_files: Optional[set[str]] = None
+        self._fs_dirs: Optional[set[str]] = None
+        # 最近一次 README 扫描结果: (内容, 扫描结果)
+        self._readme_scan: Optional[tuple[str, _ReadmeScan]] = None
+        # 代码块语言 -> 语法校验方法
+        self._block_validators: dict[str, Callable[[CodeBlock, str], Optional[Issue]]] = {
+            "json": self._validate_json,
+            "yaml": self._validate_yaml,
+            "yml": self._validate_yaml,
+        }
+    
+    def _scan_readme(self, content: str) -> _ReadmeScan:
+        """
+        单次遍历 README，同时提取版本号、License 和环境变量候选词
+        
+        合并模式在同一位置只能命中一种，版本号和 License 匹配内部
+        可能还嵌有其他类别的词（如 "VERSION: 1.2.3" 中的 VERSION、
+        "MPL-2.0" 中的 MPL），因此对这些短匹配区间再补扫一次，
+        结果与分别全文扫描一致。同一内容的结果会被缓存。
+        """
+        cached = self._readme_scan
+        if cached is not None and cached[0] == content:
+            return cached[1]
+        
+        scan = _ReadmeScan()
+        env_vars = scan.env_vars
+        is_common_word = self._is_common_word
+        best_license: Optional[tuple[int, str]] = None
+        
+        for match in _README_SCAN_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == "envvar":
+                name = match.group("envvar")
+                if not is_common_word(name):
+                    env_vars.add(name)
+                continue
+            
+            start, end = match.span()
+            if kind == "version":
+                scan.versions.append((match.group("version"), start))
+                licenses = [m.group("license") for m in _LICENSE_RE.finditer(content, start, end)]
+            else:
+                licenses = [match.group("license")]
+            
+            for name in licenses:
+                found = _LICENSE_LOOKUP[name.upper()]
+                if best_license is None or found[0] < best_license[0]:
+                    best_license = found
+            
+            for m in _ENV_VAR_RE.finditer(content, start, end):
+                name = m.group("envvar")
+                if not is_common_word(name):
+                    env_vars.add(name)
+        
+        scan.license = best_license[1] if best_license else None
+        self._readme_scan = (content, scan)
+        return scan
+    
+    def _build_fs_index(self) -> None:
+        """
+        一次遍历仓库，收集所有文件和目录的相对路径
+        
+        使用 os.scandir 的目录项类型，不对每个条目 stat。
+        符号链接不入索引，交给 _path_exists 的回退检查处理。
+        """
+        files: set[str] = set()
+        dirs: set[str] = set()
+        stack = [("", str(self.repo_path))]
+        while stack:
+            rel_dir, abs_dir = stack.pop()
+            try:
+                entries = os.scandir(abs_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel = rel_dir + entry.name
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir():
+                            dirs.add(rel)
+                            if entry.name not in IGNORED_DIR_NAMES:
+                                stack.append((rel + "/", entry.path))
+                        else:
+                            files.add(rel)
+                    except OSError:
+                        continue
+        self._fs_files = files
+        self._fs_dirs = dirs
+    
+    def _index_key(self, rel_path: str) -> Optional[str]:
+        """将链接路径规范为索引键（去掉空段和 . 段）；含 .. 或绝对路径时返回 None"""
+        if rel_path.startswith('/'):
+            return None
+        parts = [part for part in rel_path.split('/') if part and part != '.']
+        if '..' in parts:
+            return None
+        return '/'.join(parts)
+    
+    def _fs_path(self, rel_path: str) -> str:
+        """回退检查用的绝对路径字符串（与 Path 一样忽略尾部斜杠）"""
+        return os.path.join(self._repo_str, rel_path.rstrip('/'))
+    
+    def _path_exists(self, rel_path: str) -> bool:
+        """检查仓库内相对路径是否存在，索引未命中时回退到文件系统"""
+        if self._fs_files is None:
+            self._build_fs_index()
+        key = self._index_key(rel_path)
+        if key is not None and (key in self._fs_files or key in self._fs_dirs):
+            return True
+        return os.path.exists(self._fs_path(rel_path))
+    
+    def _path_is_dir(self, rel_path: str) -> bool:
+        """检查仓库内相对路径是否为目录，索引未命中时回退到文件系统"""
+        if self._fs_files is None:
+            self._build_fs_index()
+        key = self._index_key(rel_path)
+        if key is not None:
+            if key in self._fs_dirs:
+                return True
+            if key in self._fs_files:
+                return False
+        return os.path.isdir(self._fs_path(rel_path))
+    
+    def _has_index_file(self, rel_dir: str) -> bool:
+        """目录下是否存在索引文件"""
+        rel_dir = rel_dir.rstrip('/')
+        return any(self._path_exists(f"{rel_dir}/{name}") for name in INDEX_FILES)
     
     def validate_links(
         self,
@@ -95,6 +360,8 @@ class Validator:
         """
         issues: list[Issue] = []
         
+        # 先完成存在性检查，记录 (链接, 清理后的路径, 是否存在)
+        checked: list[tuple[Link, str, bool]] = []
         for link in links:
             # 跳过外部链接和 mailto
             if "://" in link.path or link.path.startswith("mailto:"):
@@ -112,39 +379,49 @@ class Validator:
                 if clean_path.startswith("./"):
                     clean_path = clean_path[2:]
                 
-                full_path = self.repo_path / clean_path
-                
                 # 检查是否存在
-                path_exists = full_path.exists()
+                path_exists = self._path_exists(clean_path)
                 
                 # 如果是目录，检查是否有索引文件（GitHub 会自动渲染）
                 if not path_exists and clean_path.endswith('/'):
-                    dir_path = self.repo_path / clean_path.rstrip('/')
-                    if dir_path.is_dir():
-                        index_files = ['README.md', 'readme.md', 'index.md', 'INDEX.md']
-                        path_exists = any((dir_path / f).exists() for f in index_files)
+                    if self._path_is_dir(clean_path.rstrip('/')):
+                        path_exists = self._has_index_file(clean_path)
                 
                 # 如果路径是目录（没有尾部斜杠），也检查索引文件
-                if full_path.is_dir():
-                    index_files = ['README.md', 'readme.md', 'index.md', 'INDEX.md']
-                    path_exists = any((full_path / f).exists() for f in index_files)
+                if path_exists and self._path_is_dir(clean_path):
+                    path_exists = self._has_index_file(clean_path)
                 
-                if not path_exists:
-                    issues.append(Issue(
-                        severity="error",
-                        code="DEAD_LINK",
-                        message=f"Link target does not exist: {link.path}",
-                        file_path=readme_path,
-                        line_number=link.line_number,
-                        suggestion=f"Check if '{link.path}' exists or fix the path",
-                    ))
-                elif link.anchor:
-                    # 验证目标文件中的锚点
-                    anchor_issue = self._validate_external_anchor(
-                        full_path, link.anchor, link, readme_path
-                    )
-                    if anchor_issue:
-                        issues.append(anchor_issue)
+                checked.append((link, clean_path, path_exists))
+        
+        # 只为需要验证锚点的链接构造 Path
+        anchor_paths: dict[str, Path] = {}
+        for link, clean_path, path_exists in checked:
+            if path_exists and link.anchor and clean_path not in anchor_paths:
+                anchor_paths[clean_path] = self.repo_path / clean_path
+        
+        # 并行预读带锚点链接指向的 Markdown 文件，填充标题 ID 缓存
+        self._prefetch_header_ids({
+            path for path in anchor_paths.values()
+            if path.suffix.lower() in _MARKDOWN_SUFFIXES
+        })
+        
+        for link, clean_path, path_exists in checked:
+            if not path_exists:
+                issues.append(Issue(
+                    severity="error",
+                    code="DEAD_LINK",
+                    message=f"Link target does not exist: {link.path}",
+                    file_path=readme_path,
+                    line_number=link.line_number,
+                    suggestion=f"Check if '{link.path}' exists or fix the path",
+                ))
+            elif link.anchor:
+                # 验证目标文件中的锚点
+                anchor_issue = self._validate_external_anchor(
+                    anchor_paths[clean_path], link.anchor, link, readme_path
+                )
+                if anchor_issue:
+                    issues.append(anchor_issue)
         
         return issues
     
@@ -156,21 +433,14 @@ class Validator:
         readme_path: str,
     ) -> Optional[Issue]:
         """验证外部文件中的锚点"""
-        if not target_path.suffix.lower() in ('.md', '.markdown'):
+        if not target_path.suffix.lower() in _MARKDOWN_SUFFIXES:
             return None  # 只验证 Markdown 文件的锚点
         
-        try:
-            content = target_path.read_text(encoding="utf-8")
-        except Exception:
+        header_ids = self._get_header_ids(target_path)
+        if header_ids is None:
             return None  # 无法读取文件，跳过锚点验证
         
-        # 简单的标题提取
-        from readme_checker.core.parser import parse_markdown
-        parsed = parse_markdown(content)
-        
-        header_ids = {h.id for h in parsed.headers}
-        
-        if anchor.lower() not in {hid.lower() for hid in header_ids}:
+        if anchor.lower() not in header_ids:
             return Issue(
                 severity="error",
                 code="INVALID_ANCHOR",
@@ -182,6 +452,47 @@ class Validator:
         
         return None
     
+    def _prefetch_header_ids(self, target_paths: set[Path]) -> None:
+        """用线程池并行读取并解析多个目标文件，结果写入标题 ID 缓存"""
+        if len(target_paths) < 2:
+            return  # 单个文件无需并行，由 _validate_external_anchor 按需读取
+        workers = min(ANCHOR_PREFETCH_WORKERS, len(target_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._get_header_ids, target_paths))
+    
+    def _seed_header_ids(self, target_path: Path, headers: list[Header]) -> None:
+        """用已解析的标题预先填充某个文件的标题 ID 缓存"""
+        try:
+            mtime = target_path.stat().st_mtime_ns
+        except OSError:
+            return
+        self._anchor_cache[target_path] = (mtime, frozenset(h.id.lower() for h in headers))
+    
+    def _get_header_ids(self, target_path: Path) -> Optional[frozenset[str]]:
+        """
+        获取 Markdown 文件的小写标题 ID 集合
+        
+        每个文件在本验证器实例中最多读取并解析一次，文件修改后（mtime 变化）重新解析。
+        直接打开文件并对句柄 fstat，不做存在性预检查。
+        
+        Returns:
+            标题 ID 集合；文件无法读取时返回 None
+        """
+        try:
+            with open(target_path, encoding="utf-8") as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                cached = self._anchor_cache.get(target_path)
+                if cached is not None and cached[0] == mtime:
+                    return cached[1]
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+        
+        parsed = parse_markdown(content)
+        header_ids = frozenset(h.id.lower() for h in parsed.headers)
+        self._anchor_cache[target_path] = (mtime, header_ids)
+        return header_ids
+    
     def validate_anchors(
         self,
         links: list[Link],
@@ -201,12 +512,14 @@ class Validator:
         """
         issues: list[Issue] = []
         
-        # 构建标题 ID 集合（小写用于不区分大小写比较）
-        header_ids = {h.id.lower() for h in headers}
+        # 标题 ID 集合（小写用于不区分大小写比较），遇到第一个页内锚点时才构建
+        header_ids: Optional[set[str]] = None
         
         for link in links:
             # 只处理页内锚点链接
             if link.path == "" and link.anchor:
+                if header_ids is None:
+                    header_ids = {h.id.lower() for h in headers}
                 anchor_lower = link.anchor.lower()
                 if anchor_lower not in header_ids:
                     issues.append(Issue(
@@ -268,7 +581,6 @@ class Validator:
         - 包含文件扩展名（.py, .js, .cpp 等）
         - 行以 │ 或空格开头
         """
-        tree_chars = {'│', '├', '└', '─', '┌', '┐', '┘', '┬', '┴', '┼', '|', '+', '\\'}
         lines = content.strip().split('\n')
         
         if not lines:
@@ -277,10 +589,10 @@ class Validator:
         tree_line_count = 0
         for line in lines:
             # 检查是否包含树形字符
-            if any(c in line for c in tree_chars):
+            if not _TREE_CHARS.isdisjoint(line):
                 tree_line_count += 1
             # 检查是否像文件路径（包含 / 或 \ 和扩展名）
-            elif re.search(r'[\\/].*\.\w+', line):
+            elif _TREE_PATH_RE.search(line):
                 tree_line_count += 1
         
         # 如果超过 50% 的行看起来像目录树，认为是目录树
@@ -305,24 +617,21 @@ class Validator:
         if len(lines) < 3 and total_chars < 50:
             return False
         
-        # 代码特征模式
-        code_patterns = [
-            r'^\s*(def|class|function|const|let|var|import|from|export)\s',
-            r'^\s*(if|for|while|switch|try|catch)\s*[\(\{]',
-            r'[=;{}()\[\]]',  # 常见代码符号
-            r'^\s*#include\s*<',  # C/C++ include
-            r'^\s*package\s+\w+',  # Java/Go package
-        ]
-        
+        # 如果代码行少于 20%，可能是纯文本
+        threshold = len(lines) * 0.2
+        remaining = len(lines)
         code_line_count = 0
         for line in lines:
-            for pattern in code_patterns:
-                if re.search(pattern, line):
-                    code_line_count += 1
-                    break
-        
-        # 如果代码行少于 20%，可能是纯文本
-        return code_line_count < len(lines) * 0.2
+            remaining -= 1
+            if _CODE_LINE_RE.search(line):
+                code_line_count += 1
+            # 结论已确定时提前返回
+            if code_line_count >= threshold:
+                return False
+            if code_line_count + remaining < threshold:
+                return True
+        
+        return code_line_count < threshold
 
     def validate_code_blocks(
         self,
@@ -365,19 +674,12 @@ class Validator:
                 ))
                 continue
             
-            lang = block.language.lower()
-            
-            # 验证 JSON
-            if lang == "json":
-                json_issue = self._validate_json(block, readme_path)
-                if json_issue:
-                    issues.append(json_issue)
-            
-            # 验证 YAML
-            elif lang in ("yaml", "yml"):
-                yaml_issue = self._validate_yaml(block, readme_path)
-                if yaml_issue:
-                    issues.append(yaml_issue)
+            # 验证 JSON / YAML 语法
+            validate = self._block_validators.get(block.language.lower())
+            if validate is not None:
+                syntax_issue = validate(block, readme_path)
+                if syntax_issue:
+                    issues.append(syntax_issue)
         
         return issues
     
@@ -441,6 +743,9 @@ class Validator:
         
         # 链接验证
         if not skip_links:
+            # README 已解析，链接回 README 自身的锚点无需再次读取解析
+            self._seed_header_ids(self.repo_path / readme_path, parsed.headers)
+            
             link_issues = self.validate_links(parsed.links, parsed.headers, readme_path)
             result.issues.extend(link_issues)
             
@@ -461,9 +766,7 @@ class Validator:
         result.stats["total_links"] = len(parsed.links)
         result.stats["total_headers"] = len(parsed.headers)
         result.stats["total_code_blocks"] = len(parsed.code_blocks)
-        result.stats["total_issues"] = len(result.issues)
-        result.stats["errors"] = sum(1 for i in result.issues if i.severity == "error")
-        result.stats["warnings"] = sum(1 for i in result.issues if i.severity == "warning")
+        result.update_issue_stats()
         
         return result
 
@@ -526,45 +829,40 @@ class Validator:
         """
         versions: list[tuple[str, int]] = []
         
-        # 版本号模式
-        patterns = [
-            # v1.2.3 或 V1.2.3
-            r'\bv?(\d+\.\d+\.\d+(?:-[\w.]+)?)\b',
-            # version: 1.2.3
-            r'version[:\s]+(\d+\.\d+\.\d+(?:-[\w.]+)?)',
-        ]
-        
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            for pattern in patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    version = match.group(1)
-                    # 过滤掉明显不是项目版本的（如 Python 3.10）
-                    if not self._is_likely_project_version(version, line):
-                        continue
-                    versions.append((version, line_num))
+        matches = self._scan_readme(content).versions
+        if not matches:
+            return versions
+        
+        # 各行起始偏移，匹配位置通过二分查找换算为行号
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(content))
+        
+        for version, start in matches:
+            line_num = bisect_right(line_starts, start)
+            line_start = line_starts[line_num - 1]
+            line_end = content.find('\n', line_start)
+            line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+            
+            # 过滤掉明显不是项目版本的（如 Python 3.10）
+            if not self._is_likely_project_version(version, line):
+                continue
+            versions.append((version, line_num))
         
         return versions
     
     def _is_likely_project_version(self, version: str, context: str) -> bool:
-        """判断版本号是否可能是项目版本"""
-        context_lower = context.lower()
+        """
+        判断版本号是否可能是项目版本
         
+        只有形似 Python/Node 运行时版本的号码需要看上下文排除，
+        其余（包括徽章、标题中的版本号）都视为项目版本，
+        因此上下文只在需要时才转换一次小写。
+        """
         # 排除 Python/Node 版本
-        if 'python' in context_lower and version.startswith('3.'):
-            return False
-        if 'node' in context_lower and version.startswith(('14.', '16.', '18.', '20.')):
-            return False
-        
-        # 徽章中的版本号通常是项目版本
-        if 'badge' in context_lower or 'shield' in context_lower:
-            return True
-        
-        # 标题中的版本号
-        if context.strip().startswith('#'):
-            return True
-        
+        if version.startswith('3.'):
+            return 'python' not in context.lower()
+        if version.startswith(_NODE_RUNTIME_VERSION_PREFIXES):
+            return 'node' not in context.lower()
         return True
     
     def _normalize_version(self, version: str) -> str:
@@ -619,39 +917,19 @@ class Validator:
         return issues
     
     def _extract_license_from_readme(self, content: str) -> Optional[str]:
-        """从 README 中提取 License"""
-        # 常见 License 名称
-        license_names = [
-            'MIT', 'Apache-2.0', 'Apache 2.0', 'GPL-3.0', 'GPL-2.0',
-            'BSD-3-Clause', 'BSD-2-Clause', 'ISC', 'MPL-2.0', 'LGPL-3.0',
-            'Unlicense', 'WTFPL', 'CC0', 'CC-BY-4.0',
-        ]
-        
-        content_upper = content.upper()
-        
-        for license_name in license_names:
-            if license_name.upper() in content_upper:
-                return license_name
+        """
+        从 README 中提取 License
         
-        return None
+        提到多个 License 时按 LICENSE_NAMES 的优先级返回。
+        """
+        return self._scan_readme(content).license
     
     def _normalize_license(self, license_str: str) -> str:
-        """标准化 License 名称"""
-        # 移除空格和连字符的差异
-        normalized = license_str.upper().replace(' ', '-').replace('_', '-')
-        
-        # 常见别名映射
-        aliases = {
-            'APACHE-2.0': 'APACHE-2.0',
-            'APACHE-2': 'APACHE-2.0',
-            'APACHE2': 'APACHE-2.0',
-            'GPL-3': 'GPL-3.0',
-            'GPL3': 'GPL-3.0',
-            'BSD-3': 'BSD-3-CLAUSE',
-            'BSD3': 'BSD-3-CLAUSE',
-        }
-        
-        return aliases.get(normalized, normalized)
+        """标准化 License 名称（常见写法直接查表）"""
+        normalized = _LICENSE_CANONICAL.get(license_str)
+        if normalized is None:
+            normalized = _canonical_license(license_str)
+        return normalized
 
 
     def validate_env_vars(
@@ -686,12 +964,13 @@ class Validator:
         documented_vars.update(dotenv_vars)
         
         # 兼容旧的 env_example_path 参数
-        if env_example_path and env_example_path.exists():
+        if env_example_path:
             try:
                 env_content = env_example_path.read_text(encoding='utf-8')
-                documented_vars.update(self._extract_env_vars_from_env_file(env_content))
-            except Exception:
+            except (OSError, UnicodeDecodeError):
                 pass
+            else:
+                documented_vars.update(self._extract_env_vars_from_env_file(env_content))
         
         # 检查每个代码中使用的环境变量
         seen_vars: set[str] = set()
@@ -718,18 +997,8 @@ class Validator:
     
     def _extract_env_vars_from_readme(self, content: str) -> set[str]:
         """从 README 中提取提到的环境变量"""
-        vars_found: set[str] = set()
-        
-        # 匹配大写字母和下划线组成的词（典型的环境变量命名）
-        pattern = re.compile(r'\b([A-Z][A-Z0-9_]{2,})\b')
-        
-        for match in pattern.finditer(content):
-            var_name = match.group(1)
-            # 过滤掉常见的非环境变量词
-            if not self._is_common_word(var_name):
-                vars_found.add(var_name)
-        
-        return vars_found
+        # 返回副本，调用方会继续合并其他来源
+        return set(self._scan_readme(content).env_vars)
     
     def _extract_env_vars_from_env_file(self, content: str) -> set[str]:
         """从 .env 文件中提取环境变量"""
@@ -740,8 +1009,10 @@ class Validator:
             if not line or line.startswith('#'):
                 continue
             
-            if '=' in line:
-                var_name = line.split('=')[0].strip()
+            # partition 一次完成查找和切分，不为等号后的各段分配列表
+            var_name, sep, _ = line.partition('=')
+            if sep:
+                var_name = var_name.strip()
                 if var_name:
                     vars_found.add(var_name)
         
@@ -749,23 +1020,11 @@ class Validator:
     
     def _is_common_env_var(self, name: str) -> bool:
         """判断是否为常见的系统环境变量"""
-        common_vars = {
-            'PATH', 'HOME', 'USER', 'SHELL', 'LANG', 'TERM',
-            'PWD', 'OLDPWD', 'HOSTNAME', 'LOGNAME',
-            'NODE_ENV', 'DEBUG', 'CI', 'GITHUB_ACTIONS',
-            'PYTHONPATH', 'PYTHONDONTWRITEBYTECODE',
-        }
-        return name in common_vars
+        return name in _COMMON_ENV_VARS
     
     def _is_common_word(self, word: str) -> bool:
         """判断是否为常见的非环境变量词"""
-        common_words = {
-            'README', 'TODO', 'FIXME', 'NOTE', 'WARNING', 'ERROR',
-            'API', 'URL', 'URI', 'HTTP', 'HTTPS', 'JSON', 'XML',
-            'HTML', 'CSS', 'SQL', 'CLI', 'GUI', 'SDK', 'IDE',
-            'MIT', 'BSD', 'GPL', 'APACHE',
-        }
-        return word in common_words
+        return word in _COMMON_WORDS
     
     def validate_system_deps(
         self,
@@ -788,42 +1047,31 @@ class Validator:
         """
         issues: list[Issue] = []
         
+        if not deps:
+            return issues
+        
+        # 唯一一处大小写转换：依赖名按小写子串比较
         readme_lower = readme_content.lower()
         
-        # 检查每个系统依赖
-        seen_deps: set[str] = set()
+        # 每个工具只取首次出现
+        first_deps: dict = {}  # tool_name -> SystemDependency
         for dep in deps:
-            tool_name = dep.tool_name.lower()
-            if tool_name in seen_deps:
+            first_deps.setdefault(dep.tool_name.lower(), dep)
+        
+        # 找出 README 中未提到的系统依赖。
+        # 安装指令中出现的工具名也是 README 的子串，不需要单独检查
+        mentioned = {tool_name for tool_name in first_deps if tool_name in readme_lower}
+        
+        for tool_name, dep in first_deps.items():
+            if tool_name in mentioned:
                 continue
-            seen_deps.add(tool_name)
-            
-            # 检查 README 中是否提到该工具
-            if tool_name not in readme_lower:
-                # 检查是否有安装指令
-                install_patterns = [
-                    f'apt-get install.*{tool_name}',
-                    f'apt install.*{tool_name}',
-                    f'brew install.*{tool_name}',
-                    f'yum install.*{tool_name}',
-                    f'dnf install.*{tool_name}',
-                    f'pacman -S.*{tool_name}',
-                    f'choco install.*{tool_name}',
-                ]
-                
-                has_install = any(
-                    re.search(pattern, readme_lower)
-                    for pattern in install_patterns
-                )
-                
-                if not has_install:
-                    issues.append(Issue(
-                        severity="warning",
-                        code="MISSING_SYS_DEP",
-                        message=f"System dependency '{dep.tool_name}' used in code but not documented",
-                        file_path=dep.file_path,
-                        line_number=dep.line_number,
-                        suggestion=f"Add installation instructions for '{dep.tool_name}' to README",
-                    ))
+            issues.append(Issue(
+                severity="warning",
+                code="MISSING_SYS_DEP",
+                message=f"System dependency '{dep.tool_name}' used in code but not documented",
+                file_path=dep.file_path,
+                line_number=dep.line_number,
+                suggestion=f"Add installation instructions for '{dep.tool_name}' to README",
+            ))
         
         return issues
@@ -6,8 +6,9 @@ different language ecosystems.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Callable, Literal, Optional
 
 
 @dataclass
@@ -46,6 +47,27 @@ class VerificationResult:
     suggestion: str | None = None
 
 
+@lru_cache(maxsize=64)
+def _parse_config_file(path_str: str, mtime_ns: int, size: int, loads: Callable[[str], Any]) -> Any:
+    return loads(Path(path_str).read_text(encoding="utf-8"))
+
+
+def load_config_file(path: Path, loads: Callable[[str], Any]) -> Any:
+    """
+    读取并解析配置文件（package.json、pyproject.toml 等）
+    
+    插件在校验每条 README 命令时都会重新读取同一个配置文件，
+    解析结果按 (路径, mtime, 大小) 缓存，文件未变化时直接复用。
+    返回的对象被多次调用共享，调用方只能读取不能修改。
+    
+    Raises:
+        OSError: 文件不存在或无法读取
+        Exception: loads 抛出的解析错误
+    """
+    st = path.stat()
+    return _parse_config_file(str(path), st.st_mtime_ns, st.st_size, loads)
+
+
 class EcosystemPlugin(ABC):
     """Base class for ecosystem plugins."""
     
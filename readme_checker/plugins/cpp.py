@@ -354,7 +354,9 @@ class CppPlugin(EcosystemPlugin):
             license_path = repo_path / lf
             if license_path.exists():
                 try:
-                    content = license_path.read_text(encoding="utf-8", errors="ignore")[:2000]
+                    # 只解码开头 2000 个字符，不读入整个文件
+                    with open(license_path, encoding="utf-8", errors="ignore") as f:
+                        content = f.read(2000)
                     content_upper = content.upper()
 
                     if "MIT LICENSE" in content_upper or "PERMISSION IS HEREBY GRANTED" in content_upper:
@@ -55,8 +55,8 @@ class GoPlugin(EcosystemPlugin):
         if subcommand == "run" and len(parts) >= 3:
             target = parts[2]
             if target == ".":
-                # Check for main.go or any .go file
-                if list(repo_path.glob("*.go")):
+                # Check for main.go or any .go file (stop at the first match)
+                if next(repo_path.glob("*.go"), None) is not None:
                     return VerificationResult(
                         claim=command,
                         status="verified",
@@ -178,7 +178,9 @@ class GoPlugin(EcosystemPlugin):
             license_path = repo_path / lf
             if license_path.exists():
                 try:
-                    content = license_path.read_text(encoding="utf-8", errors="ignore")[:2000]
+                    # 只解码开头 2000 个字符，不读入整个文件
+                    with open(license_path, encoding="utf-8", errors="ignore") as f:
+                        content = f.read(2000)
                     content_upper = content.upper()
                     
                     # 检测常见许可证
@@ -15,6 +15,13 @@ from readme_checker.plugins.base import (
     PluginRegistry,
 )
 
+# Common Gradle tasks that are always available
+_GRADLE_BUILTIN_TASKS = frozenset({
+    "build", "clean", "test", "check", "assemble",
+    "jar", "war", "bootRun", "bootJar", "tasks",
+    "dependencies", "help", "init", "wrapper",
+})
+
 
 class JavaPlugin(EcosystemPlugin):
     """Plugin for Java ecosystem (Maven/Gradle)."""
@@ -131,12 +138,7 @@ class JavaPlugin(EcosystemPlugin):
         if len(parts) >= 2:
             task = parts[-1]
             # Common Gradle tasks that are always available
-            builtin_tasks = {
-                "build", "clean", "test", "check", "assemble",
-                "jar", "war", "bootRun", "bootJar", "tasks",
-                "dependencies", "help", "init", "wrapper",
-            }
-            if task in builtin_tasks:
+            if task in _GRADLE_BUILTIN_TASKS:
                 return VerificationResult(
                     claim=command,
                     status="verified",
@@ -376,7 +378,9 @@ class JavaPlugin(EcosystemPlugin):
             license_path = repo_path / lf
             if license_path.exists():
                 try:
-                    content = license_path.read_text(encoding="utf-8", errors="ignore")[:2000]
+                    # 只解码开头 2000 个字符，不读入整个文件
+                    with open(license_path, encoding="utf-8", errors="ignore") as f:
+                        content = f.read(2000)
                     content_upper = content.upper()
                     
                     # 检测常见许可证
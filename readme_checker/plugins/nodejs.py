@@ -12,8 +12,15 @@ from readme_checker.plugins.base import (
     ProjectMetadata,
     VerificationResult,
     PluginRegistry,
+    load_config_file,
 )
 
+# Command prefixes recognised by verify_command (single str.startswith call)
+_NODE_COMMAND_PREFIXES = ("npm ", "yarn ", "pnpm ", "npx ")
+
+# Built-in npm commands that don't need a package.json script
+_NPM_BUILTIN_COMMANDS = frozenset({"install", "i", "ci", "update", "outdated", "audit", "init", "publish", "add"})
+
 
 class NodeJsPlugin(EcosystemPlugin):
     """Plugin for Node.js ecosystem."""
@@ -46,7 +53,7 @@ class NodeJsPlugin(EcosystemPlugin):
         cmd_lower = command.lower().strip()
         
         # Check if this is an npm/yarn command
-        if not any(cmd_lower.startswith(prefix) for prefix in ["npm ", "yarn ", "pnpm ", "npx "]):
+        if not cmd_lower.startswith(_NODE_COMMAND_PREFIXES):
             return None
         
         parts = command.strip().split()
@@ -74,7 +81,7 @@ class NodeJsPlugin(EcosystemPlugin):
             )
         
         try:
-            pkg = json.loads(pkg_path.read_text(encoding="utf-8"))
+            pkg = load_config_file(pkg_path, json.loads)
         except Exception as e:
             return VerificationResult(
                 claim=command,
@@ -105,8 +112,7 @@ class NodeJsPlugin(EcosystemPlugin):
             )
         
         # Built-in npm commands that don't need scripts
-        builtin_commands = {"install", "i", "ci", "update", "outdated", "audit", "init", "publish", "add"}
-        if script_name in builtin_commands:
+        if script_name in _NPM_BUILTIN_COMMANDS:
             return VerificationResult(
                 claim=command,
                 status="verified",
@@ -209,7 +215,7 @@ class NodeJsPlugin(EcosystemPlugin):
             )
         
         try:
-            pkg = json.loads(pkg_path.read_text(encoding="utf-8"))
+            pkg = load_config_file(pkg_path, json.loads)
         except Exception as e:
             return VerificationResult(
                 claim=command,
@@ -270,7 +276,7 @@ class NodeJsPlugin(EcosystemPlugin):
             return ProjectMetadata(source_file="")
         
         try:
-            content = json.loads(pkg_path.read_text(encoding="utf-8"))
+            content = load_config_file(pkg_path, json.loads)
         except Exception:
             return ProjectMetadata(source_file=str(pkg_path))
         
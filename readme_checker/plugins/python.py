@@ -13,6 +13,7 @@ from readme_checker.plugins.base import (
     ProjectMetadata,
     VerificationResult,
     PluginRegistry,
+    load_config_file,
 )
 
 # Handle tomllib/tomli for different Python versions
@@ -24,6 +25,16 @@ else:
     except ImportError:
         tomllib = None  # type: ignore
 
+# Command prefixes recognised by verify_command (single str.startswith call)
+_PYTHON_COMMAND_PREFIXES = ("python ", "python3 ", "pip ", "poetry ", "pipenv ", "pytest ")
+
+# Requirement specifier: the package name ends at the first version/extras marker
+_REQUIREMENT_NAME_END_RE = re.compile(r'[<>=!~\[]')
+
+# setup.py: install_requires = [...] and the quoted entries inside it
+_INSTALL_REQUIRES_RE = re.compile(r'install_requires\s*=\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_STRING_RE = re.compile(r'["\']([^"\']+)["\']')
+
 
 class PythonPlugin(EcosystemPlugin):
     """Plugin for Python ecosystem."""
@@ -67,8 +78,7 @@ class PythonPlugin(EcosystemPlugin):
         cmd_lower = command.lower().strip()
         
         # Check if this is a Python-related command
-        python_prefixes = ["python ", "python3 ", "pip ", "poetry ", "pipenv ", "pytest "]
-        if not any(cmd_lower.startswith(prefix) for prefix in python_prefixes):
+        if not cmd_lower.startswith(_PYTHON_COMMAND_PREFIXES):
             return None
         
         parts = command.strip().split()
@@ -215,15 +225,15 @@ class PythonPlugin(EcosystemPlugin):
                 severity="info",
             )
         
-        # 收集所有声明的依赖
+        # 收集所有声明的依赖，规范化一次后供所有包复用
         declared_deps = self._collect_declared_dependencies(repo_path)
+        normalized_deps = {d.lower().replace("-", "_").replace(".", "_") for d in declared_deps}
         
         # 检查每个包是否已声明
         missing_packages = []
         for pkg in packages:
             # 规范化包名（忽略版本号）
-            pkg_name = re.split(r'[<>=!~\[]', pkg)[0].lower().replace("-", "_").replace(".", "_")
-            normalized_deps = {d.lower().replace("-", "_").replace(".", "_") for d in declared_deps}
+            pkg_name = _REQUIREMENT_NAME_END_RE.split(pkg, 1)[0].lower().replace("-", "_").replace(".", "_")
             if pkg_name not in normalized_deps:
                 missing_packages.append(pkg)
         
@@ -258,7 +268,7 @@ class PythonPlugin(EcosystemPlugin):
                         line = line.strip()
                         if line and not line.startswith("#") and not line.startswith("-"):
                             # 提取包名（忽略版本号）
-                            pkg_name = re.split(r'[<>=!~\[]', line)[0].strip()
+                            pkg_name = _REQUIREMENT_NAME_END_RE.split(line, 1)[0].strip()
                             if pkg_name:
                                 deps.add(pkg_name)
                 except Exception:
@@ -269,16 +279,16 @@ class PythonPlugin(EcosystemPlugin):
             pyproject_path = repo_path / "pyproject.toml"
             if pyproject_path.exists():
                 try:
-                    content = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+                    content = load_config_file(pyproject_path, tomllib.loads)
                     # [project.dependencies]
                     for dep in content.get("project", {}).get("dependencies", []):
-                        pkg_name = re.split(r'[<>=!~\[]', dep)[0].strip()
+                        pkg_name = _REQUIREMENT_NAME_END_RE.split(dep, 1)[0].strip()
                         if pkg_name:
                             deps.add(pkg_name)
                     # [project.optional-dependencies]
                     for group_deps in content.get("project", {}).get("optional-dependencies", {}).values():
                         for dep in group_deps:
-                            pkg_name = re.split(r'[<>=!~\[]', dep)[0].strip()
+                            pkg_name = _REQUIREMENT_NAME_END_RE.split(dep, 1)[0].strip()
                             if pkg_name:
                                 deps.add(pkg_name)
                     # [tool.poetry.dependencies]
@@ -296,10 +306,10 @@ class PythonPlugin(EcosystemPlugin):
             try:
                 content = setup_path.read_text(encoding="utf-8")
                 # install_requires = ["pkg1", "pkg2"]
-                match = re.search(r'install_requires\s*=\s*\[(.*?)\]', content, re.DOTALL)
+                match = _INSTALL_REQUIRES_RE.search(content)
                 if match:
-                    for pkg in re.findall(r'["\']([^"\']+)["\']', match.group(1)):
-                        pkg_name = re.split(r'[<>=!~\[]', pkg)[0].strip()
+                    for pkg in _QUOTED_STRING_RE.findall(match.group(1)):
+                        pkg_name = _REQUIREMENT_NAME_END_RE.split(pkg, 1)[0].strip()
                         if pkg_name:
                             deps.add(pkg_name)
             except Exception:
@@ -345,7 +355,7 @@ class PythonPlugin(EcosystemPlugin):
             )
         
         try:
-            content = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+            content = load_config_file(pyproject_path, tomllib.loads)
             scripts = content.get("tool", {}).get("poetry", {}).get("scripts", {})
             
             if script_name in scripts:
@@ -415,7 +425,7 @@ class PythonPlugin(EcosystemPlugin):
             return ProjectMetadata(source_file=str(path))
         
         try:
-            content = tomllib.loads(path.read_text(encoding="utf-8"))
+            content = load_config_file(path, tomllib.loads)
         except Exception:
             return ProjectMetadata(source_file=str(path))
         
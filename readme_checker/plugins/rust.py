@@ -12,6 +12,7 @@ from readme_checker.plugins.base import (
     ProjectMetadata,
     VerificationResult,
     PluginRegistry,
+    load_config_file,
 )
 
 # Try to import tomllib for Cargo.toml parsing
@@ -23,6 +24,14 @@ except ImportError:
     except ImportError:
         tomllib = None  # type: ignore
 
+# Built-in cargo commands
+_CARGO_BUILTIN_COMMANDS = frozenset({
+    "build", "run", "test", "check", "clean", "doc",
+    "new", "init", "add", "remove", "update", "search",
+    "publish", "install", "uninstall", "bench", "tree",
+    "fmt", "clippy", "fix", "audit", "outdated",
+})
+
 
 class RustPlugin(EcosystemPlugin):
     """Plugin for Rust ecosystem (Cargo)."""
@@ -107,14 +116,7 @@ class RustPlugin(EcosystemPlugin):
         subcommand = parts[1]
 
         # Built-in cargo commands
-        builtin_commands = {
-            "build", "run", "test", "check", "clean", "doc",
-            "new", "init", "add", "remove", "update", "search",
-            "publish", "install", "uninstall", "bench", "tree",
-            "fmt", "clippy", "fix", "audit", "outdated",
-        }
-
-        if subcommand in builtin_commands:
+        if subcommand in _CARGO_BUILTIN_COMMANDS:
             return VerificationResult(
                 claim=command,
                 status="verified",
@@ -198,7 +200,7 @@ class RustPlugin(EcosystemPlugin):
             cargo_toml = repo_path / "Cargo.toml"
             if cargo_toml.exists():
                 try:
-                    content = tomllib.loads(cargo_toml.read_text(encoding="utf-8"))
+                    content = load_config_file(cargo_toml, tomllib.loads)
                     bins = content.get("bin", [])
                     for b in bins:
                         if b.get("name") == bin_name:
@@ -261,7 +263,7 @@ class RustPlugin(EcosystemPlugin):
             return self._extract_from_cargo_regex(cargo_toml)
 
         try:
-            content = tomllib.loads(cargo_toml.read_text(encoding="utf-8"))
+            content = load_config_file(cargo_toml, tomllib.loads)
         except Exception:
             return self._extract_from_cargo_regex(cargo_toml)
 
@@ -4,6 +4,9 @@ Rich Terminal Reporter - Colorful terminal output using Rich library
 Style: Code quality analysis tool with scores, ratings, progress bars and fun comments
 """
 
+import heapq
+from collections import Counter
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -258,13 +261,15 @@ class RichReporter:
         self.console.print("[bold]◆ Issues Found[/bold]")
         self.console.print()
         
-        # Sort by severity
-        sorted_issues = sorted(
+        # Sort by severity; only the first 10 are shown, so select them
+        # with a bounded heap instead of sorting the whole list (stable, same order)
+        top_issues = heapq.nsmallest(
+            10,
             issues,
             key=lambda x: (0 if x.severity == "error" else 1, x.file_path, x.line_number or 0)
         )
         
-        for i, issue in enumerate(sorted_issues[:10], 1):  # Show max 10
+        for i, issue in enumerate(top_issues, 1):  # Show max 10
             if issue.severity == "error":
                 icon = "❌"
                 style = "red"
@@ -319,17 +324,15 @@ class RichReporter:
         tips = []
         
         # Count issue types
-        code_counts: dict[str, int] = {}
-        for issue in result.issues:
-            code_counts[issue.code] = code_counts.get(issue.code, 0) + 1
+        code_counts = Counter(issue.code for issue in result.issues)
         
-        if code_counts.get("MISSING_ENV_VAR", 0) > 0:
+        if code_counts["MISSING_ENV_VAR"] > 0:
             tips.append("Document env vars in README or .env.example")
-        if code_counts.get("DEAD_LINK", 0) > 0 or code_counts.get("INVALID_ANCHOR", 0) > 0:
+        if code_counts["DEAD_LINK"] > 0 or code_counts["INVALID_ANCHOR"] > 0:
             tips.append("Fix broken links and anchors")
-        if code_counts.get("INVALID_COMMAND", 0) > 0:
+        if code_counts["INVALID_COMMAND"] > 0:
             tips.append("Ensure README commands actually work")
-        if code_counts.get("MISSING_SYS_DEP", 0) > 0:
+        if code_counts["MISSING_SYS_DEP"] > 0:
             tips.append("Document system dependency installation")
         
         return "; ".join(tips) if tips else "Keep up the good work!"
@@ -0,0 +1,17 @@
+"""JavaScript AST 环境变量提取测试"""
+
+import pytest
+
+from readme_checker.core.scanner.js_ast import ESPRIMA_AVAILABLE, extract_env_vars_js_ast
+
+pytestmark = pytest.mark.skipif(not ESPRIMA_AVAILABLE, reason="esprima not installed")
+
+
+def test_process_env_literal_keyword_properties():
+    """process.env.true / process.env.null 的属性是 Boolean / Null 词法单元，也应报告"""
+    content = "const a = process.env.true;\nconst b = process.env.null;\n"
+    
+    env_vars, unresolved = extract_env_vars_js_ast(content, "app.js")
+    
+    assert [(ev.name, ev.line_number) for ev in env_vars] == [("true", 1), ("null", 2)]
+    assert unresolved == []
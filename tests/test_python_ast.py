@@ -0,0 +1,19 @@
+"""Python AST 环境变量提取测试"""
+
+from readme_checker.core.scanner.python_ast import extract_all_python_env_vars
+
+
+def test_env_reads_inside_annotations():
+    """类型注解中的环境变量读取（参数、返回值、变量注解）也应报告"""
+    content = (
+        "import os\n"
+        "from typing import Annotated\n"
+        "def f(x: Annotated[str, os.getenv(\"A\")]) -> os.getenv(\"B\"):\n"
+        "    pass\n"
+        "y: Annotated[int, os.environ[\"C\"]] = 0\n"
+    )
+    
+    env_vars, config_env_vars, _ = extract_all_python_env_vars(content, "app.py")
+    
+    found = sorted((ev.name, ev.line_number) for ev in env_vars + config_env_vars)
+    assert found == [("A", 3), ("B", 3), ("C", 5)]